@@ -0,0 +1,71 @@
+"""Compares `Image.from_bytes` with `Image.decode` on screenshot-sized pngs.
+
+Usage:
+    python benchmarks/decode.py [--repeat N] [--color-space RGB]
+"""
+import argparse
+import statistics
+import time
+
+import cv2 as cv
+import numpy as np
+
+from unearthtime.imaging.image import Image
+
+SIZES = {
+    '720p': (1280, 720),
+    '1080p': (1920, 1080),
+    '1440p': (2560, 1440),
+    '4K': (3840, 2160)
+}
+
+
+def screenshot_png(width: int, height: int, channels: int = 4) -> bytes:
+    """A png that compresses roughly like a map screenshot: smooth gradients with some noise."""
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    base = (x + y) / 2
+    planes = [(base + rng.normal(0, 8, (height, width))).clip(0, 255).astype(np.uint8) for _ in range(3)]
+
+    if channels == 4:
+        planes.append(np.full((height, width), 255, np.uint8))
+
+    ok, png = cv.imencode('.png', np.dstack(planes))
+    assert ok
+
+    return png.tobytes()
+
+
+def time_ms(fn, repeat: int) -> float:
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--color-space', default='RGB')
+    args = parser.parse_args()
+
+    print(f'{"size":>6} {"from_bytes":>12} {"decode":>10} {"saved":>8}')
+
+    for name, (width, height) in SIZES.items():
+        png = screenshot_png(width, height)
+
+        assert np.array_equal(Image.from_bytes(png, args.color_space).array, Image.decode(png, args.color_space).array)
+
+        before = time_ms(lambda: Image.from_bytes(png, args.color_space), args.repeat)
+        after = time_ms(lambda: Image.decode(png, args.color_space), args.repeat)
+
+        print(f'{name:>6} {before:>10.1f}ms {after:>8.1f}ms {before - after:>6.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from unearthtime._algae.exceptions import UnearthtimeException
+from unearthtime.imaging.download import ConnectionPool, download, download_all
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        if self.path.startswith('/image/'):
+            self.__respond(200, f'image {self.path[7:]}'.encode())
+        elif self.path.startswith('/redirect/'):
+            self.__respond(302, b'', {'Location': f'/image/{self.path[10:]}'})
+        elif self.path == '/loop':
+            self.__respond(302, b'', {'Location': '/loop'})
+        elif self.path == '/flaky':
+            with self.server.lock:
+                self.server.flaky += 1
+                status = 503 if self.server.flaky == 1 else 200
+
+            self.__respond(status, b'flaky')
+        else:
+            self.__respond(404, b'not found')
+
+    def log_message(self, *args):
+        pass
+
+    def __respond(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.connections, httpd.flaky, httpd.lock = 0, 0, threading.Lock()
+    httpd.url = f'http://127.0.0.1:{httpd.server_address[1]}'
+
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    yield httpd
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_download_all_reuses_connections(server, tmp_path):
+    urls = [f'{server.url}/image/{i}' for i in range(22)]
+    paths = [str(tmp_path / f'{i}.png') for i in range(22)]
+
+    downloads = download_all(urls, paths, workers=4)
+
+    assert all(downloads)
+    assert [d.url for d in downloads] == urls
+    assert server.connections <= 4
+
+    for i, path in enumerate(paths):
+        with open(path, 'rb') as file:
+            assert file.read() == f'image {i}'.encode()
+
+
+def test_fetch_reuses_one_connection_in_sequence(server):
+    with ConnectionPool(1) as pool:
+        for i in range(5):
+            status, _, body, attempts = pool.fetch(f'{server.url}/image/{i}')
+
+            assert (status, body, attempts) == (200, f'image {i}'.encode(), 1)
+
+    assert server.connections == 1
+
+
+def test_download_reports_not_found(server, tmp_path):
+    path = str(tmp_path / 'missing.png')
+
+    with ConnectionPool() as pool:
+        result = download(f'{server.url}/missing', path, pool)
+
+    assert not result
+    assert result.status == 404
+    assert isinstance(result.error, UnearthtimeException)
+    assert not os.listdir(tmp_path)
+
+
+def test_fetch_follows_redirects(server):
+    with ConnectionPool() as pool:
+        status, _, body, attempts = pool.fetch(f'{server.url}/redirect/7')
+
+    assert (status, body, attempts) == (200, b'image 7', 1)
+
+
+def test_fetch_stops_redirect_loops(server):
+    with ConnectionPool() as pool, pytest.raises(UnearthtimeException):
+        pool.fetch(f'{server.url}/loop')
+
+
+def test_fetch_retries_transient_statuses(server):
+    with ConnectionPool() as pool:
+        status, _, body, attempts = pool.fetch(f'{server.url}/flaky')
+
+    assert (status, body, attempts) == (200, b'flaky', 2)
+
+
+def test_fetch_raises_after_connection_errors():
+    with ConnectionPool(timeout=1) as pool, pytest.raises(UnearthtimeException):
+        pool.fetch('http://127.0.0.1:9/image/0', retries=1)
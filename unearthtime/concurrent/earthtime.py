@@ -1,11 +1,88 @@
 import concurrent.futures
 from functools import partial
-from typing import Union
+from typing import Iterable, Sequence, Union
 
 from .response import ConcurrentHit, ConcurrentHitList
 from .._algae.exceptions import UnearthtimeException
+from .._algae.utils import raiseif
 from ..earthtime import _ImplicitWait, DriverType, EarthTime
 from ..explore.response import Hit, HitList
+from ..imaging.encoder import Encoder
+from ..imaging.sink import ReorderSink, ShardSink, Sink
+
+
+def capture_timeline(pages: Sequence[EarthTime], sink: Sink, frames: Iterable[int] = None, color_space: str = 'RGB',
+                     source: str = None, timeout: Union[float, int] = 30, encoder: Encoder = None,
+                     executor: concurrent.futures.Executor = None) -> Sink:
+    """Sweeps the timeline across several pages, each capturing a share of the frames.
+
+    Parameters:
+        - `pages`: `Sequence[EarthTime]`
+        - `sink`: `Sink`
+        - `frames`: `Iterable[int]` = `None`
+        - `color_space`: `str` = 'RGB'
+        - `source`: `str` = `None`
+        - `timeout`: `float`, `int` = 30
+        - `encoder`: `Encoder` = `None`
+        - `executor`: `Executor` = `None`
+
+    Returns:
+        - `Sink`: `sink`, opened and closed.
+
+    Raises:
+        - `UnearthtimeException`: No pages.
+
+    Notes:
+        - The pages should show the same view, e.g. the `pages` of a `ConcurrentEarthtime` or
+        pages acquired from an `EarthTimePool` with the same url.
+        - Frames are written to `sink` by their position in `frames`.
+        - Each page captures a contiguous range of frames, unless `sink` is ordered. Then the
+        frames are dealt out round-robin, so the pages move through the sweep together, and
+        fed through a `ReorderSink`, so `sink` still receives them in order. Only frames that
+        run ahead of the slowest page are buffered, with at most `max_buffered` of them held in
+        memory and the rest spilled to disk; see `ReorderSink`.
+        - See `EarthTime.capture_timeline`.
+    """
+    raiseif(
+        not pages,
+        UnearthtimeException('Expected at least one EarthTime page.')
+    )
+
+    frames = list(frames) if frames is not None else list(range(len(pages[0].timelapse.getCaptureTimes())))
+    shards = []
+
+    if sink.ordered:
+        for i, page in enumerate(pages[:len(frames)]):
+            shards.append((page, i, len(pages), frames[i::len(pages)]))
+    else:
+        size, extra = divmod(len(frames), len(pages))
+        start = 0
+
+        for i, page in enumerate(pages):
+            end = start + size + (i < extra)
+
+            if end > start:
+                shards.append((page, start, 1, frames[start:end]))
+
+            start = end
+
+    target = ReorderSink(sink) if sink.ordered else sink
+    target.open(len(frames))
+
+    def run(shard):
+        page, offset, stride, shard_frames = shard
+        page.capture_timeline(ShardSink(target, offset, stride), shard_frames, color_space, source, timeout, encoder)
+
+    try:
+        if executor is None:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(shards) or 1) as executor:
+                list(executor.map(run, shards))
+        else:
+            list(executor.map(run, shards))
+    finally:
+        target.close()
+
+    return sink
 
 
 class ConcurrentEarthtime:
@@ -68,6 +145,17 @@ class ConcurrentEarthtime:
     def pages(self):
         return self.__pool
     
+    def capture_timeline(self, sink: Sink, frames: Iterable[int] = None, color_space: str = 'RGB', source: str = None,
+                         timeout: Union[float, int] = 30, encoder: Encoder = None) -> Sink:
+        """Sweeps the timeline across this instance's pages.
+
+        Pages take frames round-robin when `sink` is ordered, or a contiguous range each otherwise.
+
+        Notes:
+            - See `capture_timeline`.
+        """
+        return capture_timeline(self.__pool, sink, frames, color_space, source, timeout, encoder, self.__exc)
+    
     def is_running(self):
         return self.__running and all(self.__exc.map(lambda et: et.is_running(), self.__pool))
     
@@ -9,14 +9,21 @@ Attributes:
     - `ElementPredicate : `(Element) -> bool, ([Element,]) -> bool, (Hit) -> bool, (HitList) -> bool
     - `_Explore`: `str` = 'https://earthtime.org/explore'
     - `_ImplicitWait : `int` = 0
+    - `_LayerModes : `{str}`
+    - `_ReadyTimeout : `int` = 30
+    - `_SnapshotAll : `str` = '__snapshot__'
+    - `_TimelineSources : `{str}`
 """
 
 from __future__ import annotations
 
 import time
+from binascii import a2b_base64
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache, singledispatchmethod as overloaded
 from queue import Queue
-from typing import Callable, Final, Iterable, Union
+from typing import Callable, Dict, Final, Iterable, List, Union
 
 from selenium.common.exceptions import InvalidSessionIdException
 from selenium.webdriver.remote.webdriver import WebDriver as Driver
@@ -25,21 +32,169 @@ from selenium.webdriver.remote.webdriver import WebElement as Element
 from ._algae.exceptions import UnearthtimeException
 from ._algae.strings import ismalformedurl, resolvequery
 from ._algae.utils import isnullary, istrue, raiseif
+from ._algae.warnings import overridinguseof
 from .explore.library import Library
 from .explore.locator import ForcedLocator
-from .explore.query import By, WaitType, find as ufind, find_all as ufind_all
+from .explore.query import By, WaitType, find as ufind, find_all as ufind_all, script_timeout
 from .explore.registry import Registry
-from .explore.response import Hit, HitList, Miss
+from .explore.response import Hit, HitList, Miss, Snapshot
+from .explore.script import SNAPSHOT
 from .imaging.image import AspectRatio, Image, Thumbnail
 from .imaging.image import DEFAULT_HEIGHT, DEFAULT_WIDTH
-from .timelapse import Timelapse
+from .imaging.encoder import Encoder, default_encoder
+from .imaging.sink import Sink
+from .timelapse import FRAME_DRAWN, Timelapse
 
 DriverType = Union[Driver, Callable[[], Driver]]
 ElementPredicate = Callable[[Union[Element, Iterable[Element], Hit, HitList]], bool]
 
 _Explore: Final[str] = 'https://earthtime.org/explore'
 _ImplicitWait: Final[int] = 0
+_LayerModes: Final[set] = {'add', 'remove', 'set'}
 _LoadedWait = 0.5
+_ReadyTimeout: Final[int] = 30
+_SnapshotAll: Final[str] = '__snapshot__'
+_TimelineSources: Final[set] = {'canvas', 'player', 'screenshot'}
+
+_Ready = FRAME_DRAWN + '''
+var callback = arguments[arguments.length - 1], timeout = arguments[0], drawn = arguments[1], start = Date.now();
+
+(function check() {
+    if (document.readyState === 'complete' && (!drawn || frameDrawn())) {
+        callback(true);
+    } else if (Date.now() - start > timeout) {
+        callback(false);
+    } else {
+        setTimeout(check, 25);
+    }
+})();
+'''
+
+_CanvasPixels = '''
+function canvasPixels(callback) {
+    var canvas = (window.timelapse && typeof timelapse.getCanvas === 'function' && timelapse.getCanvas()) ||
+                 document.querySelector('#timeMachine_timelapse_dataPanes canvas, div.player canvas');
+
+    if (!canvas) {
+        callback(null);
+        return;
+    }
+
+    requestAnimationFrame(function () {
+        var gl = canvas.getContext('webgl2') || canvas.getContext('webgl') || canvas.getContext('experimental-webgl');
+        var width, height, pixels, flipped;
+
+        if (gl) {
+            var attributes = gl.getContextAttributes();
+
+            if (!attributes || !attributes.preserveDrawingBuffer) {
+                callback({error: 'The map canvas does not preserve its drawing buffer, so its pixels cannot be read back.'});
+                return;
+            }
+
+            width = gl.drawingBufferWidth;
+            height = gl.drawingBufferHeight;
+            pixels = new Uint8Array(width * height * 4);
+            flipped = true;
+            gl.readPixels(0, 0, width, height, gl.RGBA, gl.UNSIGNED_BYTE, pixels);
+        } else {
+            width = canvas.width;
+            height = canvas.height;
+            pixels = new Uint8Array(canvas.getContext('2d').getImageData(0, 0, width, height).data.buffer);
+            flipped = false;
+        }
+
+        var binary = '';
+
+        for (var i = 0; i < pixels.length; i += 0x8000) {
+            binary += String.fromCharCode.apply(null, pixels.subarray(i, i + 0x8000));
+        }
+
+        callback({width: width, height: height, flipped: flipped, data: btoa(binary)});
+    });
+}
+'''
+
+_CaptureCanvas = _CanvasPixels + '''
+canvasPixels(arguments[arguments.length - 1]);
+'''
+
+_CaptureFrame = FRAME_DRAWN + _CanvasPixels + '''
+var frame = arguments[0], timeout = arguments[1], pixels = arguments[2], callback = arguments[arguments.length - 1], start = Date.now();
+
+if (typeof timelapse === 'undefined') {
+    callback(null);
+} else {
+    if (!timelapse.isPaused()) timelapse.pause();
+
+    timelapse.seekToFrame(frame);
+
+    requestAnimationFrame(function check() {
+        var current = typeof timelapse.getCurrentFrameNumber === 'function' ? timelapse.getCurrentFrameNumber() : frame;
+
+        if (current === frame && frameDrawn()) {
+            if (pixels) {
+                canvasPixels(callback);
+            } else {
+                callback({});
+            }
+        } else if (Date.now() - start > timeout) {
+            callback(null);
+        } else {
+            requestAnimationFrame(check);
+        }
+    });
+}
+'''
+
+_Layers = '''
+var targets = arguments[0], mode = arguments[1], boxes = [];
+
+Array.prototype.forEach.call(document.querySelectorAll("label[name] > input[type='checkbox']"), function (box) {
+    var table = box.closest('table'),
+        header = table && table.id ? document.querySelector("[aria-controls='" + table.id + "']") : null;
+
+    boxes.push({box: box, name: box.parentElement.getAttribute('name'), category: header ? header.id : ''});
+});
+
+function matches(entry, target) {
+    return typeof target === 'string' ? entry.name === target : entry.category === target[0] && entry.name === target[1];
+}
+
+function wanted(entry) {
+    return targets.some(function (target) { return matches(entry, target); });
+}
+
+function active() {
+    var names = [];
+
+    boxes.forEach(function (entry) {
+        if (entry.box.checked && names.indexOf(entry.name) < 0) names.push(entry.name);
+    });
+
+    return names;
+}
+
+if (mode === null) return active();
+
+boxes.forEach(function (entry) {
+    if (entry.box.checked && (mode === 'set' ? !wanted(entry) : mode === 'remove' && wanted(entry))) entry.box.click();
+});
+
+if (mode !== 'remove') {
+    targets.forEach(function (target) {
+        var found = boxes.filter(function (entry) { return matches(entry, target); });
+
+        if (found.length && !found.some(function (entry) { return entry.box.checked; })) found[0].box.click();
+    });
+}
+
+return active();
+'''
+
+
+def _has_timelapse(url: str) -> bool:
+    return 'stories/' not in url
 
 
 class EarthTime:
@@ -118,7 +273,7 @@ class EarthTime:
     
     @classmethod
     def explore(cls, driver: DriverType, url: str = _Explore, load_wait: Union[float, int] = 0,
-                imp_wait: Union[float, int] = _ImplicitWait):
+                imp_wait: Union[float, int] = _ImplicitWait, ready_timeout: Union[float, int] = _ReadyTimeout):
         """Instantiates and loads an `EarthTime` page.
 
         Parameters:
@@ -126,16 +281,18 @@ class EarthTime:
             - `url`: `str`
             - `load_wait`: `float`, `int` = 0
             - `imp_wait`: `float`, `int` = 0
+            - `ready_timeout`: `float`, `int` = 30
         """
         et = cls(driver, url)
-        et.load(load_wait, imp_wait)
+        et.load(load_wait, imp_wait, ready_timeout)
         
         return et
     
     @classmethod
     def explore_from_hash(cls, driver: DriverType, hash_: str, root_url: str = _Explore,
                           load_wait: Union[float, int] = 0,
-                          imp_wait: Union[float, int] = _ImplicitWait):
+                          imp_wait: Union[float, int] = _ImplicitWait,
+                          ready_timeout: Union[float, int] = _ReadyTimeout):
         """Instantiates and loads an `EarthTime` page from a hash.
 
         Parameters:
@@ -143,13 +300,14 @@ class EarthTime:
             - `hash_`: `str`
             - `load_wait`: `float`, `int` = 0
             - `imp_wait`: `float`, `int` = 0
+            - `ready_timeout`: `float`, `int` = 30
 
         Notes:
             - `hash_` should not have a '#' in front of it. The `url` will be rendered as 
             `root_url#hash_to_layer_or_waypoint`
         """
         et = cls(driver, f'{root_url}#{hash_}')
-        et.load(load_wait, imp_wait)
+        et.load(load_wait, imp_wait, ready_timeout)
         
         return et
     
@@ -187,6 +345,169 @@ class EarthTime:
         """The `Timelapse` associated with this instance."""
         return self.__timelapse
     
+    def active_layers(self) -> List[str]:
+        """The names of the layers currently selected in the Data Library."""
+        return list(self.__driver.execute_script(_Layers, [], None) or [])
+    
+    def add_layers(self, names: Iterable[Union[str, tuple]]) -> List[str]:
+        """Selects the given layers, keeping those already selected.
+
+        Parameters:
+            - `names`: `Iterable[str, (str, str)]`
+
+        Returns:
+            - `[str]`: The names of the selected layers afterwards.
+
+        Notes:
+            - See `set_layers`.
+        """
+        return self.__apply_layers(names, 'add')
+    
+    def capture_canvas(self, color_space: str = 'RGBA', timeout: Union[float, int] = 10, fallback: bool = True) -> Image:
+        """Reads the pixels of the map canvas in-page, without a png screenshot.
+
+        The canvas of `timelapse` is read with `gl.readPixels` on the next animation frame,
+        and the raw RGBA pixels are sent back and wrapped in an `Image` without copying.
+
+        A WebGL canvas clears its drawing buffer once it has been presented, so it can only
+        be read outside of its own draw when its context was created with
+        `preserveDrawingBuffer`. Otherwise, rather than return a blank image, this warns and
+        falls back to a screenshot of the `Player` if `fallback`, or raises.
+
+        Parameters:
+            - `color_space`: `str` = 'RGBA'
+            - `timeout`: `float`, `int` = 10
+            - `fallback`: `bool` = `True`
+
+        Returns:
+            - `Image`
+
+        Raises:
+            - `UnearthtimeException`: There is no map canvas on the page, or it is a WebGL canvas
+            without `preserveDrawingBuffer` and not `fallback`.
+
+        Notes:
+            - Only the map is captured, not the page around it.
+            - In 'RGBA', the array of the image is a read-only view; see `Image.from_raw`.
+        """
+        with script_timeout(self.__driver, timeout):
+            canvas = self.__driver.execute_async_script(_CaptureCanvas)
+        
+        raiseif(
+            not canvas,
+            UnearthtimeException('No map canvas to capture.')
+        )
+        
+        if 'error' in canvas:
+            raiseif(
+                not fallback,
+                UnearthtimeException(canvas.get('error'))
+            )
+            
+            overridinguseof('canvas', 'player')
+            
+            return Image.decode(self.Player.screenshot('png'), color_space)
+        
+        return Image.from_raw(a2b_base64(canvas['data']), canvas['width'], canvas['height'], 4, canvas['flipped'], 'RGBA', color_space)
+    
+    def capture_timeline(self, sink: Sink, frames: Iterable[int] = None, color_space: str = 'RGB', source: str = None,
+                         timeout: Union[float, int] = 30, encoder: Encoder = None) -> Sink:
+        """Sweeps the timeline, capturing each frame into a sink.
+
+        Each frame is seeked to, waited on until `timelapse` has completely drawn it, and
+        captured, all in one script. The capture is then handed to the `encoder` to be
+        decoded and written, so the page is already seeking to the next frame while the
+        previous one is being encoded.
+
+        Parameters:
+            - `sink`: `Sink`
+            - `frames`: `Iterable[int]` = `None`
+            - `color_space`: `str` = 'RGB'
+            - `source`: `str` = `None`
+            - `timeout`: `float`, `int` = 30
+            - `encoder`: `Encoder` = `None`
+
+        Returns:
+            - `Sink`: `sink`, opened and closed.
+
+        Raises:
+            - `UnearthtimeException`: Invalid `source`, a frame was not drawn within `timeout` seconds,
+            or `source` is 'canvas' and the canvas cannot be read; see `capture_canvas`.
+
+        Notes:
+            - If `frames` is `None`, every frame of `getCaptureTimes` is captured.
+            - Frames are written to `sink` by their position in `frames`.
+            - Valid sources are:
+                - canvas: The map, read from its canvas. See `capture_canvas`.
+                - player: A screenshot of the `Player`.
+                - screenshot: A screenshot of the window.
+            - If `source` is `None`, the canvas is captured, but if it cannot be read, this warns
+            and captures the `Player` instead, from that frame on.
+            - Writes to an ordered `sink` are made from a single thread, in order.
+        """
+        raiseif(
+            source is not None and source not in _TimelineSources,
+            UnearthtimeException(f':[{source}]: Invalid timeline source.')
+        )
+        
+        fallback, source = source is None, source or 'canvas'
+        frames = list(frames) if frames is not None else list(range(len(self.__timelapse.getCaptureTimes())))
+        encoder = encoder or default_encoder()
+        writer = ThreadPoolExecutor(max_workers=1) if sink.ordered else None
+        pending = deque()
+        
+        with script_timeout(self.__driver, timeout + 5):
+            sink.open(len(frames))
+            
+            try:
+                for index, frame in enumerate(frames):
+                    capture = self.__driver.execute_async_script(_CaptureFrame, frame, timeout * 1000, source == 'canvas')
+                    
+                    raiseif(
+                        capture is None,
+                        UnearthtimeException(f':[{frame}]: Frame was not drawn after {timeout} seconds.')
+                    )
+                    
+                    if 'error' in capture:
+                        raiseif(
+                            not fallback,
+                            UnearthtimeException(f':[{frame}]: {capture.get("error")}')
+                        )
+                        
+                        overridinguseof('canvas', 'player')
+                        fallback, source = False, 'player'
+                    
+                    if source == 'screenshot':
+                        capture = self.__driver.get_screenshot_as_png()
+                    elif source == 'player':
+                        capture = self.Player.screenshot('png')
+                    
+                    if writer is not None:
+                        image = encoder.submit(EarthTime.__frame_image, capture, color_space)
+                        pending.append(writer.submit(lambda i=index, f=image: sink.write(i, f.result())))
+                    else:
+                        pending.append(encoder.submit(lambda i=index, c=capture: sink.write(i, EarthTime.__frame_image(c, color_space))))
+                    
+                    while len(pending) > encoder.max_pending:
+                        pending.popleft().result()
+                
+                while pending:
+                    pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+                
+                for future in pending:
+                    if not future.cancelled():
+                        future.exception()
+                
+                if writer is not None:
+                    writer.shutdown()
+                
+                sink.close()
+        
+        return sink
+    
     def execute(self, javascript: str, *args):
         """Executes a string a javascript
 
@@ -247,16 +568,19 @@ class EarthTime:
             
             return Thumbnail(url, dim)
     
-    def goto(self, url: str):
+    def goto(self, url: str, ready_timeout: Union[float, int] = _ReadyTimeout):
         """Navigates driver to an EarthTime page.
 
         Parameters:
             - `url`: `str`
+            - `ready_timeout`: `float`, `int` = 30
 
         Exceptions:
-            `UnearthtimeException`: `url` is not of one of forms: 
-                - 'https://earthtime.org/explore'
-                - 'https://earthtime.org/stories/story_name'.
+            `UnearthtimeException`:
+                - `url` is not of one of forms: 
+                    - 'https://earthtime.org/explore'
+                    - 'https://earthtime.org/stories/story_name'.
+                - The page is not ready within `ready_timeout` seconds.
         """
         
         raiseif(
@@ -266,7 +590,14 @@ class EarthTime:
         )
         
         self.__driver.get(url)
-        time.sleep(2.5)
+
+        raiseif(
+            not self.__ready(url, ready_timeout),
+            UnearthtimeException(f':[{url}]: Page was not ready after {ready_timeout} seconds.')
+        )
+
+        if self.__timelapse is not None:
+            self.__timelapse.invalidate()
     
     def hide_extras(self):
         """Hides the container with extras content if it is visible."""
@@ -338,19 +669,29 @@ class EarthTime:
             else:
                 return Miss
     
-    def load(self, load_wait: Union[float, int] = 0, imp_wait: Union[float, int] = _ImplicitWait):
+    def load(self, load_wait: Union[float, int] = 0, imp_wait: Union[float, int] = _ImplicitWait,
+             ready_timeout: Union[float, int] = _ReadyTimeout):
         """Instantiates the `WebDriver` of this instance and loads the page of the given `url`.
 
         Parameters:
             - `load_wait`: `float`, `int` = 0
             - `imp_wait`: `float`, `int` = 0
+            - `ready_timeout`: `float`, `int` = 30
 
         Exceptions:
-            - `UnearthtimeException`: The `WebDriver` for this
-            instance is already connected to an `EarthTime` object.
+            - `UnearthtimeException`:
+                - The `WebDriver` for this instance is already connected to an `EarthTime` object.
+                - The page is not ready within `ready_timeout` seconds. The `WebDriver` is quit
+                first if it was created by this instance, or released if it was given to it.
+
+        Notes:
+            - See `wait_until_ready` for when a page is ready. If `ready_timeout` is 0 or `None`,
+            readiness is not checked.
         """
         if not self.is_running():
-            if callable(self.__driver):
+            owned = callable(self.__driver)
+            
+            if owned:
                 self.__driver = self.__driver()
                 
                 raiseif(
@@ -360,9 +701,6 @@ class EarthTime:
             
             self.__driver._EarthTimePage = self
             self.__driver.get(self.__url)
-            
-            time.sleep(1)
-            
             self.__driver.maximize_window()
             
             if load_wait > 0:
@@ -374,6 +712,16 @@ class EarthTime:
             self.__timelapse = Timelapse(self.__driver)
             self.__running = True
             self.__total_pages += 1
+            
+            if not self.__ready(self.__url, ready_timeout):
+                url = self.__url
+                
+                if owned:
+                    self.quit()
+                else:
+                    self.release_driver()
+                
+                raise UnearthtimeException(f':[{url}]: Page was not ready after {ready_timeout} seconds.')
     
     def map_loaded(self, max_reloads: int = 2, draw_calls: int = 0,
                    wait: Union[float, int] = _LoadedWait) -> bool:
@@ -409,11 +757,15 @@ class EarthTime:
         
         return not spinner and self.lastFrameCompletelyDrawn
     
-    def new_session(self, url: str = _Explore):
+    def new_session(self, url: str = _Explore, ready_timeout: Union[float, int] = _ReadyTimeout):
         """Starts a new driver session, a page loaded with the given url.
 
         Parameters:
             * `url`: str = 'https://earthtime.org/explore'
+            * `ready_timeout`: `float`, `int` = 30
+
+        Exceptions:
+            - `UnearthtimeException`: The page is not ready within `ready_timeout` seconds.
         """
         
         raiseif(
@@ -424,10 +776,41 @@ class EarthTime:
         
         self.__driver.start_session({})
         self.__driver.get(url)
+        self.__driver.maximize_window()
         
-        time.sleep(2)
+        raiseif(
+            not self.__ready(url, ready_timeout),
+            UnearthtimeException(f':[{url}]: Page was not ready after {ready_timeout} seconds.')
+        )
         
-        self.__driver.maximize_window()
+        if self.__timelapse is not None:
+            self.__timelapse.invalidate()
+    
+    def observe(self, key: Union[str, tuple], condition: str = 'displayed', timeout: Union[float, int] = 10, forced: bool = False):
+        """Waits in-page until a condition holds for the `Locator` of the given name and arguments.
+
+        Parameters:
+            - `key`: `str`, `tuple`
+            - `condition`: `str` = 'displayed'
+            - `timeout`: `float`, `int` = 10
+            - `forced`: `bool` = `False`
+
+        Returns:
+            - `Hit`, `HitList`, `Miss`, `bool`
+
+        Notes:
+            - See `Locator.observe` for valid conditions.
+        """
+        name, args = (key[0], key[1:]) if isinstance(key, tuple) else (key, ())
+        query = name if name in self.__registry else (
+            rname if (rname := resolvequery(name)) in self.__registry else '')
+        
+        if not query:
+            return Miss if condition in ('displayed', 'present') else False
+        
+        locator = self.__registry[query] if not forced else ForcedLocator.from_locator(self.__registry[query])
+        
+        return locator.observe(self.__driver, *args, condition=condition, timeout=timeout)
     
     def pause_at_end(self):
         """Pauses the timeline and sets it to the end."""
@@ -435,11 +818,14 @@ class EarthTime:
             if btn['title'] == 'Pause':
                 btn.click()
             
-            if not self.isPaused():
-                self.__driver.execute_script('timelapse.pause();')
+            with self.__timelapse.batch() as batch:
+                paused, times = batch.isPaused(), batch.getCaptureTimes()
             
-            self.__driver.execute_script(
-                f'timelapse.seekToFrame({len(self.getCaptureTimes()) - 1});')
+            with self.__timelapse.batch() as batch:
+                if not paused.result():
+                    batch.pause()
+                
+                batch.seekToFrame(len(times.result()) - 1)
     
     def pause_at_middle(self):
         """Pauses the timeline and setis it to the middle.
@@ -451,11 +837,14 @@ class EarthTime:
             if btn['title'] == 'Pause':
                 btn.click()
             
-            if not self.isPaused():
-                self.__driver.execute_script('timelapse.pause();')
+            with self.__timelapse.batch() as batch:
+                paused, times = batch.isPaused(), batch.getCaptureTimes()
             
-            self.__driver.execute_script(
-                f'timelapse.seekToFrame({len(self.getCaptureTimes()) // 2});')
+            with self.__timelapse.batch() as batch:
+                if not paused.result():
+                    batch.pause()
+                
+                batch.seekToFrame(len(times.result()) // 2)
     
     def pause_at_start(self):
         """Pauses the timeline and sets it to the beginning."""
@@ -463,10 +852,14 @@ class EarthTime:
             if btn['title'] == 'Pause':
                 btn.click()
             
-            if not self.isPaused():
-                self.__driver.execute_script('timelapse.pause();')
+            with self.__timelapse.batch() as batch:
+                paused = batch.isPaused()
             
-            self.__driver.execute_script('timelapse.seekToFrame(0);')
+            with self.__timelapse.batch() as batch:
+                if not paused.result():
+                    batch.pause()
+                
+                batch.seekToFrame(0)
     
     def quit(self):
         """Closes the page and quits the `WebDriver` of this instance."""
@@ -494,6 +887,20 @@ class EarthTime:
             
             return driver
     
+    def remove_layers(self, names: Iterable[Union[str, tuple]]) -> List[str]:
+        """Deselects the given layers, keeping the rest selected.
+
+        Parameters:
+            - `names`: `Iterable[str, (str, str)]`
+
+        Returns:
+            - `[str]`: The names of the selected layers afterwards.
+
+        Notes:
+            - See `set_layers`.
+        """
+        return self.__apply_layers(names, 'remove')
+    
     def retry_query(self, index: int = -1):
         """Retries the query at a given index of the history.
 
@@ -501,10 +908,17 @@ class EarthTime:
             `index`: int = -1
 
         Returns:
-            - `Hit`, `HitList`, `Miss`
+            - `Hit`, `HitList`, `Miss`, `{str, tuple: Snapshot}`
         """
-        return self.pull(self.__history[index]) if -len(self.__history) <= index < len(
-            self.__history) else Miss
+        if not -len(self.__history) <= index < len(self.__history):
+            return Miss
+        
+        query = self.__history[index]
+        
+        if query == _SnapshotAll or query == (_SnapshotAll, True):
+            return self.snapshot(forced=query != _SnapshotAll)
+        
+        return self.pull(query)
     
     def retry_query_if(self, key: Union[str, tuple], condition: Union[bool, ElementPredicate], actions: Callable[[], None] = None):
         """Attempts to retrieve an element based on a given `Locator` name,
@@ -552,21 +966,34 @@ class EarthTime:
         elif mode == 'base64':
             return self.__driver.get_screenshot_as_base64()
         elif mode in ('img', 'IMG', 'image'):
-            return Image.from_bytes(self.__driver.get_screenshot_as_png())
+            return Image.decode(self.__driver.get_screenshot_as_png())
         elif mode in ('array', 'ndarray'):
-            return Image.from_bytes(self.__driver.get_screenshot_as_png()).array()
+            return Image.decode(self.__driver.get_screenshot_as_png()).array
         else:
-            return Image.from_bytes(self.__driver.get_screenshot_as_png(), mode)
+            return Image.decode(self.__driver.get_screenshot_as_png(), mode)
     
-    def screenshot_and_save(self, fp: str, color_space: str = 'RGB', format_=None, **params):
+    def screenshot_and_save(self, fp: str, color_space: str = 'RGB', format_=None, async_: bool = False,
+                            encoder: Encoder = None, **params) -> Union[Future, None]:
         """Screenshots the window and saves it as a '.png'
 
         Parameters:
             - `fp`: `str` = './'
             - `color_space`: str = 'BGR'
             - `format` = None
+            - `async_`: `bool` = `False`
+            - `encoder`: `Encoder` = `None`
             - `**params`
+
+        Returns:
+            - `Future`, `None`: A future resolving to `fp` if saved asynchronously.
+
+        Notes:
+            - If `async_` or an `encoder` is given, only the png is taken on this thread, and it is
+            decoded and saved by the `encoder`, or the shared one, so the page can move on.
         """
+        if async_ or encoder is not None:
+            return (encoder or default_encoder()).save(self.__driver.get_screenshot_as_png(), fp, color_space, format_, **params)
+        
         self.screenshot(color_space).save(fp, format_, **params)
     
     def screenshot_player(self, mode: str = 'RGB'):
@@ -584,17 +1011,100 @@ class EarthTime:
         """
         return self.Player.screenshot(mode)
     
-    def screenshot_player_and_save(self, fp: str, color_space: str = 'RGB', format_=None, **params):
+    def screenshot_player_and_save(self, fp: str, color_space: str = 'RGB', format_=None, async_: bool = False,
+                                   encoder: Encoder = None, **params) -> Union[Future, None]:
         """Screenshots the data panes and saves it.
 
         Parameters:
             - `fp`: `str` = './'
             - `color_space`
             - `format`
+            - `async_`: `bool` = `False`
+            - `encoder`: `Encoder` = `None`
             - `**params`
+
+        Returns:
+            - `Future`, `None`: A future resolving to `fp` if saved asynchronously.
+
+        Notes:
+            - See `screenshot_and_save`.
         """
-        self.Player.screenshot_and_save(fp, color_space, format_, **params)
+        return self.Player.screenshot_and_save(fp, color_space, format_, async_, encoder, **params)
     
+    def snapshot(self, keys: Iterable[Union[str, tuple]] = None, forced: bool = False) -> Dict[Union[str, tuple], Snapshot]:
+        """Captures the state of many `Locator`s with a single script.
+
+        Parameters:
+            - `keys`: `Iterable[str, tuple]` = `None`
+            - `forced`: `bool` = `False`
+
+        Returns:
+            - `{str, tuple: Snapshot}`
+
+        Notes:
+            - Each key has the same form as for `pull`, i.e. the name of a `Locator`
+            or a tuple of the name followed by the arguments for its callable terms.
+            Wait conditions are not supported.
+            - If `keys` is `None`, every `Locator` in the registry without callable
+            terms is captured, and a single entry is added to the history, which
+            `retry_query` replays as another full snapshot.
+        """
+        if keys is None:
+            keys = self.__registry.keys()
+            strict = False
+        else:
+            strict = True
+
+        entries, snapshots = [], {}
+
+        for key in keys:
+            name, args = (key[0], key[1:]) if isinstance(key, tuple) else (key, ())
+            query = name if name in self.__registry else (
+                rname if (rname := resolvequery(name)) in self.__registry else '')
+
+            if not query:
+                snapshots[key] = Snapshot(key, False, False, Miss, {}, '')
+                continue
+
+            locator = self.__registry[query]
+
+            try:
+                alternatives = locator.alternatives(*args)
+            except UnearthtimeException:
+                if strict:
+                    raise
+                continue
+
+            entries.append((key, locator.list_, [alternatives, locator.list_, forced or isinstance(locator, ForcedLocator)]))
+
+        if strict:
+            self.__history.extend(
+                key if not forced else (key if isinstance(key, tuple) else (key,)) + (True,) for key, _, _ in entries)
+        else:
+            self.__history.append(_SnapshotAll if not forced else (_SnapshotAll, True))
+
+        results = self.__driver.execute_script(SNAPSHOT, [entry for _, _, entry in entries]) if entries else []
+
+        for (key, list_, _), res in zip(entries, results):
+            elements, descriptions = res['elements'], res['descriptions']
+
+            if not res['matched']:
+                response = Miss
+            elif list_:
+                response = HitList(elements)
+            else:
+                response = Hit(elements[0])
+
+            snapshots[key] = Snapshot(
+                key,
+                bool(elements),
+                any(res['displayed']),
+                response,
+                descriptions if list_ else (descriptions[0] if descriptions else {}),
+                [d['innerText'] for d in descriptions] if list_ else (descriptions[0]['innerText'] if descriptions else ''))
+
+        return snapshots
+
     def set_hash(self, hash_: str, wait: Union[float, int] = _LoadedWait):
         """Alters the url to include a hash."""
         self(f"window.location.hash = '{hash_}'")
@@ -602,6 +1112,79 @@ class EarthTime:
         if wait > 0:
             time.sleep(wait)
     
+    def set_layers(self, names: Iterable[Union[str, tuple]]) -> List[str]:
+        """Makes the given layers the only ones selected.
+
+        The currently selected layers are diffed against `names` in-page, and only the
+        checkboxes that need to change are toggled, all in a single script. The Data
+        Library does not need to be open.
+
+        Parameters:
+            - `names`: `Iterable[str, (str, str)]`
+
+        Returns:
+            - `[str]`: The names of the selected layers afterwards.
+
+        Raises:
+            - `UnearthtimeException`: A layer is neither a name nor a (category id, name) pair.
+
+        Notes:
+            - Names are the share link identifiers of layers, i.e. `Layer.name`. A name
+            listed under several categories is selected through its first checkbox; pass
+            a (category id, name) pair, as a `Layer` is identified, to pick the checkbox
+            of one category.
+            - Names that are not in the Data Library are ignored, and will be missing
+            from the result.
+        """
+        return self.__apply_layers(names, 'set')
+    
+    def wait_until_ready(self, timeout: Union[float, int] = _ReadyTimeout, drawn: bool = True) -> bool:
+        """Waits until the page has loaded and, if `drawn`, `timelapse` has completely drawn its first frame.
+
+        The condition is checked in-page, and this returns as soon as it holds,
+        rather than after a fixed wait.
+
+        Parameters:
+            - `timeout`: `float`, `int` = 30
+            - `drawn`: `bool` = `True`
+
+        Returns:
+            - `bool`: Whether or not the page was ready within `timeout` seconds.
+
+        Notes:
+            - Story pages have no `timelapse`, so `drawn` should be `False` for them.
+        """
+        with script_timeout(self.__driver, timeout + 5):
+            return istrue(self.__driver.execute_async_script(_Ready, timeout * 1000, drawn))
+    
+    def __apply_layers(self, names: Iterable[Union[str, tuple]], mode: str) -> List[str]:
+        raiseif(
+            mode not in _LayerModes,
+            UnearthtimeException(f':[{mode}]: Invalid layer mode.')
+        )
+        
+        names = [names] if isinstance(names, str) else [name if isinstance(name, str) else tuple(name) for name in names]
+        
+        for name in names:
+            raiseif(
+                not isinstance(name, str) and (len(name) != 2 or not all(isinstance(part, str) for part in name)),
+                UnearthtimeException(f':[{name}]: Expected a layer name or a (category id, name) pair.')
+            )
+        
+        names = [name if isinstance(name, str) else list(name) for name in dict.fromkeys(names)]
+        
+        return list(self.__driver.execute_script(_Layers, names, mode) or [])
+    
+    @staticmethod
+    def __frame_image(capture: Union[bytes, dict], color_space: str) -> Image:
+        if isinstance(capture, dict):
+            return Image.from_raw(a2b_base64(capture['data']), capture['width'], capture['height'], 4, capture['flipped'], 'RGBA', color_space)
+        else:
+            return Image.decode(capture, color_space)
+    
+    def __ready(self, url: str, timeout: Union[float, int]) -> bool:
+        return not timeout or self.wait_until_ready(timeout, _has_timelapse(url))
+    
     @staticmethod
     def __reset_driver():
         EarthTime.__total_pages -= 1
@@ -670,7 +1253,7 @@ class EarthTimePool:
     
     def acquire(self, url: str = _Explore, load_wait: Union[float, int] = 0,
                 imp_wait: Union[float, int] = _ImplicitWait, block: bool = True,
-                timeout: float = None):
+                timeout: float = None, ready_timeout: Union[float, int] = _ReadyTimeout):
         if self.__available_count > 0:
             et = self.__available.get_nowait()
             
@@ -682,16 +1265,19 @@ class EarthTimePool:
                 else:
                     self.__occupied[et.session_id] = et
                     self.__available_count -= 1
-                    return self.acquire(url, load_wait, imp_wait, block, timeout)
+                    return self.acquire(url, load_wait, imp_wait, block, timeout, ready_timeout)
             else:
-                return self.acquire(url, load_wait, imp_wait, block, timeout)
+                return self.acquire(url, load_wait, imp_wait, block, timeout, ready_timeout)
             
             et.driver.start_session({})
             et.driver.get(url)
-            
-            time.sleep(2)
-            
             et.driver.maximize_window()
+
+            if ready_timeout and not et.wait_until_ready(ready_timeout, _has_timelapse(url)):
+                et.close()
+                self.__available.put_nowait(et)
+                
+                raise UnearthtimeException(f':[{url}]: Page was not ready after {ready_timeout} seconds.')
             
             if load_wait > 0:
                 time.sleep(load_wait)
@@ -704,23 +1290,26 @@ class EarthTimePool:
         elif self.__size > 0:
             
             if len(self.__occupied) < self.__size:
-                et = EarthTime.explore(self.__driver, url, imp_wait)
+                et = self.__explore(url, imp_wait, ready_timeout)
             else:
                 et = self.__available.get(block, timeout)
                 
                 et.driver.start_session({})
                 et.driver.get(url)
-                
-                time.sleep(5)
-                
                 et.driver.maximize_window()
                 
+                if ready_timeout and not et.wait_until_ready(ready_timeout, _has_timelapse(url)):
+                    et.close()
+                    self.__available.put_nowait(et)
+                    
+                    raise UnearthtimeException(f':[{url}]: Page was not ready after {ready_timeout} seconds.')
+                
                 if imp_wait > 0:
                     et.driver.implicitly_wait(imp_wait)
                 
                 self.__available_count -= 1
         else:
-            et = EarthTime.explore(self.__driver, url, imp_wait)
+            et = self.__explore(url, imp_wait, ready_timeout)
         
         self.__occupied[et.session_id] = et
         
@@ -769,3 +1358,9 @@ class EarthTimePool:
         if bool(et):
             et.close()
             self.__available.put_nowait(et)
+    
+    def __explore(self, url: str, imp_wait: Union[float, int], ready_timeout: Union[float, int]) -> EarthTime:
+        et = EarthTime(self.__driver, url)
+        et.load(imp_wait=imp_wait, ready_timeout=ready_timeout)
+        
+        return et
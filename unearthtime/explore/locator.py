@@ -1,29 +1,48 @@
 """The locator module defines classes for defining repeatable queries to the DOM.
 
 The difference between a `Locator` and a `ForcedLocator` is that a `Locator` will
-only return a `Hit` if the element is displayed. `ForcedLocator` returns a response
-according to what is returned from the DOM, whether the element is displayed or not.
+only return a `Hit` if the element is displayed, and a `HitList` of only the displayed
+elements. `ForcedLocator` returns a response according to what is returned from the
+DOM, whether the element is displayed or not.
+
+Locators with several term-by alternatives are compiled into a single in-page script,
+see `Locator.compile`, so that all alternatives are tried in one round trip.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, Iterable, Union
+import json
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Tuple, Union
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver as Driver
 
-from .query import By, find, find_all, ResponseType, WaitType, WebObject
+from .query import By, displayed_only, find, find_all, ResponseType, script_timeout, WaitType, WebObject
 from .response import Hit, HitList, Miss
+from .script import FIND_ALTERNATIVES, OBSERVE
 from .._algae.exceptions import UnearthtimeException
-from .._algae.utils import is_nonstring_iterable, raiseif, where
+from .._algae.utils import is_nonstring_iterable, raiseif
 from .._algae.warnings import overridinguseof
 
 __all__ = ['ForcedLocator', 'Locator']
 
+_Conditions = ('absent', 'displayed', 'hidden', 'present')
+
+
+def _implicit_wait(driver: Driver) -> float:
+    try:
+        return driver.timeouts.implicit_wait or 0
+    except (AttributeError, WebDriverException):
+        return 0
+
 
 @dataclass
 class Locator:
     """A 'self-aware' element locator.
 
     Given a successful response from the DOM, the element is only returned
-    if it is displayed.
+    if it is displayed. For list locators, only the displayed elements are
+    returned, filtered in-page with a single script.
 
     Attributes:
         - `terms` : `str`, `Callable`, `Iterable[`str`, `Callable`]
@@ -35,6 +54,7 @@ class Locator:
     by: Union[By, Iterable[By]] = By.CSS
     list_: bool = False
     until: WaitType = None
+    _compiled: Dict[tuple, str] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def __call__(self, parent: WebObject, *args, until: WaitType = None, **kwargs) -> ResponseType:
         """Sends a request to the DOM.
@@ -83,6 +103,9 @@ class Locator:
         else:
             until = self.until
 
+        if not until and is_nonstring_iterable(self.terms):
+            return self.locate(parent, *args, **kwargs)
+
         if is_nonstring_iterable(self.terms):
             if isinstance(self.by, Iterable):
                 raiseif(
@@ -97,7 +120,7 @@ class Locator:
                 query = term(*args, **kwargs) if callable(term) else term
 
                 if self.list_:
-                    if (hits := find_all(query, by, parent, until)) and where(lambda h: h.is_displayed(), hits):
+                    if hits := displayed_only(find_all(query, by, parent, until)):
                         return hits
                 elif (hit := find(query, by, parent, until)) and hit.is_displayed():
                     return hit
@@ -107,8 +130,7 @@ class Locator:
             query = self.terms(*args, **kwargs) if callable(self.terms) else self.terms
 
             if self.list_:
-                if (hits := find_all(query, self.by, parent, until)) and where(lambda h: h.is_displayed(), hits):
-                    return hits
+                return displayed_only(find_all(query, self.by, parent, until))
             elif (hit := find(query, self.by, parent, until)) and hit.is_displayed():
                 return hit
             else:
@@ -139,6 +161,201 @@ class Locator:
                 self.by.value.display_name.lstrip('by-').replace('-', ' ').upper(),
                 HitList.__name__ if self.list_ else Hit.__name__)
 
+    def compile(self, *args, **kwargs) -> str:
+        """Compiles this locator into a javascript finder covering all of its term-by alternatives.
+
+        The script takes the parent element as its only argument, or `null` for the
+        document, and returns the first matching alternative along with the visibility
+        of its elements.
+
+        Parameters:
+            - `*args`
+            - `**kwargs`
+
+        Returns:
+            - `str`
+
+        Raises:
+            - `UnearthtimeException` : See `queries`.
+
+        Notes:
+            - The script is cached on this locator for each set of hashable arguments.
+        """
+        try:
+            key = (args, tuple(sorted(kwargs.items())))
+
+            if key in self._compiled:
+                return self._compiled[key]
+        except TypeError:
+            key = None
+
+        script = '%s\nreturn findAlternatives(arguments[0] || document, %s, %s, %s);' % (
+            FIND_ALTERNATIVES,
+            json.dumps(self.alternatives(*args, **kwargs)),
+            json.dumps(self.list_),
+            json.dumps(isinstance(self, ForcedLocator)))
+
+        if key is not None:
+            self._compiled[key] = script
+
+        return script
+
+    def locate(self, parent: WebObject, *args, **kwargs) -> ResponseType:
+        """Sends a request to the DOM, trying every term-by alternative in a single script.
+
+        Parameters:
+            - `parent` : `WebDriver`, `WebElement`
+            - `*args`
+            - `**kwargs`
+
+        Returns:
+            - `Hit`
+            - `HitList`
+            - `Miss`
+
+        Raises:
+            - `UnearthtimeException` :
+                - See `queries`.
+                - Invalid `parent`.
+
+        Notes:
+            - If nothing matches and the driver has an implicit wait, the locator is observed
+            in-page for up to that long, as the individual finds would have waited.
+        """
+        raiseif(
+            parent is None,
+            UnearthtimeException('No driver or element provided to locate element.')
+        )
+
+        driver, root = (parent, None) if isinstance(parent, Driver) else (parent.parent, parent)
+        res = driver.execute_script(self.compile(*args, **kwargs), root)
+
+        if not res['matched']:
+            if wait := _implicit_wait(driver):
+                return self.observe(parent, *args, condition='present' if isinstance(self, ForcedLocator) else 'displayed',
+                                    timeout=wait, **kwargs)
+
+            return Miss
+        elif self.list_:
+            return HitList(res['elements'])
+        else:
+            return Hit(res['elements'][0])
+
+    def observe(self, parent: WebObject, *args, condition: str = 'displayed', timeout: Union[float, int] = 10,
+                **kwargs) -> Union[ResponseType, bool]:
+        """Waits in-page until a condition holds for this locator.
+
+        The locator and condition are installed in the page behind a `MutationObserver`,
+        so a single script blocks until the condition holds, instead of polling from Python.
+
+        Parameters:
+            - `parent` : `WebDriver`, `WebElement`
+            - `*args`
+            - `condition` : `str` = 'displayed'
+            - `timeout` : `float`, `int` = 10
+            - `**kwargs`
+
+        Returns:
+            - `Hit`, `HitList`, `Miss` : For 'displayed' and 'present', the located
+            element(s) once the condition holds, otherwise `Miss`.
+            - `bool` : For 'hidden' and 'absent', whether the condition held within `timeout`.
+
+        Raises:
+            - `UnearthtimeException` :
+                - See `queries`.
+                - Unrecognized `condition`.
+                - Invalid `parent`.
+
+        Notes:
+            - Valid conditions are:
+                - 'displayed' : At least one element is displayed.
+                - 'present' : At least one element is in the DOM.
+                - 'hidden' : No element is displayed.
+                - 'absent' : No element is in the DOM.
+        """
+        raiseif(
+            condition not in _Conditions,
+            UnearthtimeException(f':[{condition}]: Unrecognized condition.')
+        )
+
+        raiseif(
+            parent is None,
+            UnearthtimeException('No driver or element provided to locate element.')
+        )
+
+        alternatives = self.alternatives(*args, **kwargs)
+        driver, root = (parent, None) if isinstance(parent, Driver) else (parent.parent, parent)
+
+        with script_timeout(driver, timeout + 5):
+            res = driver.execute_async_script(OBSERVE, root, alternatives, self.list_, isinstance(self, ForcedLocator), condition, timeout * 1000)
+
+        if condition in ('absent', 'hidden'):
+            return bool(res['satisfied'])
+        elif not res['satisfied']:
+            return Miss
+        elif self.list_:
+            return HitList(res['found']['elements'])
+        else:
+            return Hit(res['found']['elements'][0])
+
+    def alternatives(self, *args, **kwargs) -> List[List[str]]:
+        """The resolved queries of this locator, serialized as `[query, by]` pairs for in-page scripts.
+
+        Parameters:
+            - `*args`
+            - `**kwargs`
+
+        Returns:
+            - `[[str, str],]`: Each `by` is the `canonical_name` of its `By`.
+
+        Raises:
+            - `UnearthtimeException` : See `queries`.
+        """
+        return [[query, by.value.canonical_name] for query, by in self.queries(*args, **kwargs)]
+
+
+    def queries(self, *args, **kwargs) -> List[Tuple[str, By]]:
+        """The resolved query of every term-by alternative of this locator, in order.
+
+        Parameters:
+            - `*args`
+            - `**kwargs`
+
+        Returns:
+            - `[(str, By),]`
+
+        Raises:
+            - `UnearthtimeException` :
+                - Arguments are passed in without any callable locators.
+                - No arguments are passed in for callable locators.
+                - Insufficient term-by pairs.
+        """
+        callable_terms = callable(self.terms) or (is_nonstring_iterable(self.terms) and any(map(callable, self.terms)))
+
+        raiseif(
+            (bool(args) or bool(kwargs)) and not callable_terms,
+            UnearthtimeException('Locator does not have any callable terms.')
+        )
+
+        raiseif(
+            not (bool(args) or bool(kwargs)) and callable_terms,
+            UnearthtimeException('No arguments provided for callable term(s).')
+        )
+
+        if is_nonstring_iterable(self.terms):
+            if isinstance(self.by, Iterable):
+                raiseif(
+                    len(self.terms) != len(self.by),
+                    UnearthtimeException('Insufficient term-by pairs.')
+                )
+                bys = self.by
+            else:
+                bys = [self.by] * len(self.terms)
+
+            return [(term(*args, **kwargs) if callable(term) else term, by) for term, by in zip(self.terms, bys)]
+        else:
+            return [(self.terms(*args, **kwargs) if callable(self.terms) else self.terms, self.by)]
+
 
 class ForcedLocator(Locator):
     """A 'self-aware' element locator.
@@ -204,6 +421,9 @@ class ForcedLocator(Locator):
         else:
             until = self.until
 
+        if not until and is_nonstring_iterable(self.terms):
+            return self.locate(parent, *args, **kwargs)
+
         if is_nonstring_iterable(self.terms):
             if isinstance(self.by, Iterable):
                 raiseif(
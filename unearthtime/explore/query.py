@@ -25,20 +25,22 @@ Attributes:
 from __future__ import annotations
 
 from collections import namedtuple
+from contextlib import contextmanager
 from enum import Enum
 from typing import Callable, Literal, Union
 
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from selenium.webdriver.remote.webdriver import WebDriver as Driver
 from selenium.webdriver.remote.webelement import WebElement as Element
 from selenium.webdriver.support.ui import WebDriverWait
 
 from .response import Hit, HitList, Miss, MissType
+from .script import FILTER_DISPLAYED
 from .._algae.deco import returnonexception
 from .._algae.exceptions import UnearthtimeException
 
-__all__ = ['By', 'fclass', 'fcss', 'fid', 'find', 'find_all', 'fname', 'ftag', 'fxpath',
-           'fxclass', 'fxcss', 'fxid', 'fxname', 'fxtag', 'fxxpath', 'response_of', 'wait_for']
+__all__ = ['By', 'displayed_only', 'fclass', 'fcss', 'fid', 'find', 'find_all', 'fname', 'ftag', 'fxpath',
+           'fxclass', 'fxcss', 'fxid', 'fxname', 'fxtag', 'fxxpath', 'response_of', 'script_timeout', 'wait_for']
 
 ResponseType = Union[Hit, HitList, MissType]
 WaitType = Callable[[Driver], Union[Hit, HitList, Literal[False]]]
@@ -48,6 +50,51 @@ WebObject = Union[Driver, Element]
 def response_of(method: Callable): return returnonexception(Miss, (NoSuchElementException, TimeoutException))(method)
 
 
+def displayed_only(hits: ResponseType) -> ResponseType:
+    """Filters a list of elements down to those that are displayed.
+
+    The check is done in-page with a single script, rather than one
+    `is_displayed()` command per element.
+
+    Parameters:
+        - `hits` : `HitList`, `Miss`
+
+    Returns:
+        - `HitList`, `Miss`
+    """
+    if not hits:
+        return Miss
+
+    displayed = hits[0]._element.parent.execute_script(FILTER_DISPLAYED, [hit._element for hit in hits])
+
+    return HitList(displayed) if displayed else Miss
+
+
+@contextmanager
+def script_timeout(driver: Driver, timeout: Union[float, int]):
+    """Sets the script timeout of a driver for the duration of a block, restoring it after.
+
+    Parameters:
+        - `driver` : `WebDriver`
+        - `timeout` : `float`, `int`
+
+    Notes:
+        - If the previous timeout cannot be read, it is left as `timeout`.
+    """
+    try:
+        previous = driver.timeouts.script
+    except (AttributeError, WebDriverException):
+        previous = None
+
+    driver.set_script_timeout(timeout)
+
+    try:
+        yield
+    finally:
+        if previous is not None:
+            driver.set_script_timeout(previous)
+
+
 def wait_for(webobj: WebObject, timeout: Union[float, int] = 10, poll_freq: Union[float, int] = 0.5):
     return WebDriverWait(webobj, timeout, poll_freq) if isinstance(webobj, Driver) else WebDriverWait(webobj.parent, timeout, poll_freq)
 
@@ -220,7 +267,7 @@ def fxname(query: str, until: WaitType = None):
         - `(Union[WebDriver, WebElement])` -> `Hit`, `HitList`, `Miss`
     """
     if not until:
-        return response_of(lambda parent: Hit(parent.find_elements_by_name(query)) if parent else Miss)
+        return response_of(lambda parent: HitList(parent.find_elements_by_name(query)) if parent else Miss)
     else:
         return response_of(lambda parent: HitList(wait_for(parent).until(until(parent.find_elements_by_name(query))) if parent else Miss))
 
@@ -236,7 +283,7 @@ def fxtag(query: str, until: WaitType = None):
         - `(Union[WebDriver, WebElement])` -> `Hit`, `HitList`, `Miss`
     """
     if not until:
-        return response_of(lambda parent: Hit(parent.find_elements_by_tag_name(query)) if parent else Miss)
+        return response_of(lambda parent: HitList(parent.find_elements_by_tag_name(query)) if parent else Miss)
     else:
         return response_of(lambda parent: HitList(wait_for(parent).until(until(parent.find_elements_by_tag_name(query))) if parent else Miss))
 
@@ -67,6 +67,8 @@ class Registry:
             if key in map_:
                 del map_[key]
 
+    def keys(self): return sorted(self.__dictionary.keys())
+
     def first_for(self, key: str):
         for map_ in self.__dictionary.maps:
             if key in map_:
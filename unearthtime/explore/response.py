@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 import hashlib
+from concurrent.futures import Future
+from dataclasses import dataclass
 from functools import partial
 from time import sleep, time
-from typing import Iterable, Union, Tuple
+from typing import Iterable, List, Union, Tuple
 
 from selenium.common.exceptions import ElementClickInterceptedException
 from selenium.common.exceptions import ElementNotInteractableException
 from selenium.webdriver.remote.webelement import WebElement as Element
 
+from .script import HIT_STATE
+from ..imaging.encoder import Encoder, default_encoder
 from ..imaging.image import Image
 
 
@@ -32,9 +36,23 @@ class Miss(metaclass=MissType):
 class Hit:
     """A successful response from the DOM."""
 
-    def __init__(self, element: Element):
+    def __init__(self, element: Element, display: str = None, attributes: dict = None):
+        """
+        Parameters:
+            - `element` : `WebElement`
+            - `display` : `str` = None
+            - `attributes` : `dict` = None
+
+        Notes:
+            - `display` is the display in the style of the element. If it is not
+            provided, it is fetched from the DOM the first time it is needed.
+            - `attributes` is a prefetched map of tag attributes, along with `tagName`
+            and `innerText`, that is served without querying the DOM. It is a snapshot
+            and is not updated if the element changes.
+        """
         self._element = element
-        self.__display = element.parent.execute_script('return arguments[0].style.display', element)
+        self.__attributes = attributes
+        self.__display = display
 
     def __eq__(self, other: Union[Element, 'Hit']):
         return self._element == other if isinstance(other, Element) else self._element == other._element
@@ -54,10 +72,19 @@ class Hit:
         Notes:
             - `id` and `class` are special cases and these tag attributes can be accessed
             by appending an underscore
+            - Members of the underlying `WebElement` take precedence, except `text`, which
+            is read from a prefetched `innerText` when there is one. Other prefetched
+            attributes are only served for names the element does not define.
         """
+        if self.__attributes is not None and attr == 'text' and 'innerText' in self.__attributes:
+            return self.__attributes['innerText']
+
         if hasattr(self._element, attr):
             return self._element.__getattribute__(attr)
         else:
+            if self.__attributes is not None and (key := attr[:-1] if attr in ('id_', 'class_') else attr) in self.__attributes:
+                return self.__attributes[key]
+
             if attr in ('id_', 'class_'):
                 attr = attr[:-1]
 
@@ -99,11 +126,27 @@ class Hit:
         Returns:
             - `str`
         """
+        if self.__attributes is not None and attr in self.__attributes:
+            return self.__attributes[attr]
+
         return self.get_attribute(attr)
 
     def __repr__(self):
         return '%s[%s]' % (Hit.__name__, self._id)
 
+    @property
+    def attributes(self) -> Union[dict, None]:
+        """The prefetched attributes of this element, if any."""
+        return self.__attributes
+
+    @property
+    def display(self) -> str:
+        """The display in the style of this element when it was first inspected."""
+        if self.__display is None:
+            self.__display = self._element.parent.execute_script('return arguments[0].style.display', self._element)
+
+        return self.__display
+
     @property
     def driver_session_id(self):
         """The session if of the Selenium driver for this element."""
@@ -117,6 +160,9 @@ class Hit:
     @property
     def tag_name(self) -> str:
         """The tag type of this element."""
+        if self.__attributes is not None and 'tagName' in self.__attributes:
+            return self.__attributes['tagName']
+
         return self._element.parent.execute_script('return arguments[0].tagName', self._element)
 
     def click(self, wait: Union[float, int] = 0):
@@ -137,7 +183,7 @@ class Hit:
 
     def hide(self):
         """Hides the element by setting the display in the style attribute to 'none'."""
-        if self.__display != 'none':
+        if self.display != 'none':
             self._element.parent.execute_script("arguments[0].style.display='none'", self._element)
 
     def next_sibling(self):
@@ -156,6 +202,14 @@ class Hit:
         """
         return Hit(self._element.find_element_by_xpath('./..'))
 
+    def prefetch(self) -> 'Hit':
+        """A copy of this hit with its attributes prefetched in a single script.
+
+        Returns:
+            - `Hit`
+        """
+        return HitList([self], prefetch=True)[0]
+
     def previous_sibling(self):
         """The sibling element preceding this element.
 
@@ -166,7 +220,7 @@ class Hit:
 
     def reset_display(self):
         """Sets the display in the style of this element back to it's original state."""
-        self._element.parent.execute_script("arguments[0].style.display='%s'" % self.__display, self._element)
+        self._element.parent.execute_script("arguments[0].style.display='%s'" % self.display, self._element)
 
     def screenshot(self, mode: str = 'png'):
         """Takes a screenshot of this element."""
@@ -176,32 +230,92 @@ class Hit:
         elif mode == 'base64':
             return self._element.screenshot_as_base64
         elif mode == 'img' or mode == 'image':
-            return Image.from_bytes(self._element.screenshot_as_png)
+            return Image.decode(self._element.screenshot_as_png)
         elif mode == 'array' or mode == 'ndarray':
-            return Image.from_bytes(self._element.screenshot_as_png).array
+            return Image.decode(self._element.screenshot_as_png).array
         else:
-            return Image.from_bytes(self._element.screenshot_as_png, mode)
+            return Image.decode(self._element.screenshot_as_png, mode)
 
-    def screenshot_and_save(self, fp: str, color_space: str = 'RGB', format_=None, **params):
+    def screenshot_and_save(self, fp: str, color_space: str = 'RGB', format_=None, async_: bool = False,
+                            encoder: Encoder = None, **params) -> Union[Future, None]:
         """Screenshots this element and saves it as a '.png'
 
         Parameters:
             - `fp`: `str` = './'
             - `color_space`: str = 'BGR'
             - `format` = None
+            - `async_`: `bool` = `False`
+            - `encoder`: `Encoder` = `None`
             - `**params`
+
+        Returns:
+            - `Future`, `None`: A future resolving to `fp` if saved asynchronously.
+
+        Notes:
+            - If `async_` or an `encoder` is given, only the png is taken on this thread, and it is
+            decoded and saved by the `encoder`, or the shared one.
         """
+        if async_ or encoder is not None:
+            return (encoder or default_encoder()).save(self._element.screenshot_as_png, fp, color_space, format_, **params)
+
         self.screenshot(color_space).save(fp, format_, **params)
 
 
 class HitList(Tuple[Hit]):
     """A collection of successful responses from the DOM."""
 
-    def __new__(cls, hits: Iterable[Union[Element, Hit]] = None):
-        if hits:
+    def __new__(cls, hits: Iterable[Union[Element, Hit]] = None, display: bool = False, prefetch: bool = False):
+        """
+        Parameters:
+            - `hits` : `Iterable[WebElement, Hit]` = None
+            - `display` : `bool` = False
+            - `prefetch` : `bool` = False
+
+        Notes:
+            - If `display` is `True`, the display in the style of every element is
+            captured with a single script, instead of lazily per element.
+            - If `prefetch` is `True`, the attributes of every element are collected
+            with the same script, see `Hit`.
+        """
+        if not hits:
+            return tuple.__new__(cls)
+        elif not (display or prefetch):
             return tuple.__new__(cls, (hit if isinstance(hit, Hit) else Hit(hit) for hit in hits))
         else:
-            return tuple.__new__(cls)
+            elements = [hit._element if isinstance(hit, Hit) else hit for hit in hits]
+            states = elements[0].parent.execute_script(HIT_STATE, elements, display, prefetch)
+
+            return tuple.__new__(cls, (Hit(element, *state) for element, state in zip(elements, states)))
 
     def __repr__(self):
         return '%s[%s]' % (HitList.__name__, '\n\t%s\n' % '\n\t'.join(map(str, self)) if bool(self) else '')
+
+    def prefetch(self) -> 'HitList':
+        """A copy of this list with the attributes of every hit prefetched in a single script.
+
+        Returns:
+            - `HitList`
+        """
+        return HitList(self, prefetch=True)
+
+
+@dataclass
+class Snapshot:
+    """The state of a `Locator` captured from the DOM in a single script.
+
+    Attributes:
+        - `key` : `str`, `tuple`
+        - `present` : `bool`
+        - `displayed` : `bool`
+        - `response` : `Hit`, `HitList`, `Miss`
+        - `attributes` : `dict`, `[dict,]`
+        - `text` : `str`, `[str,]`
+    """
+    key: Union[str, tuple]
+    present: bool
+    displayed: bool
+    response: Union[Hit, HitList, MissType]
+    attributes: Union[dict, List[dict]]
+    text: Union[str, List[str]]
+
+    def __bool__(self): return bool(self.response)
@@ -0,0 +1,165 @@
+"""The script module defines javascript that is executed in-page to answer queries in a single round trip.
+
+Each `WebDriver` command is a full round trip to the browser, so work that would otherwise
+be done element by element from Python is expressed here as javascript and sent once.
+
+Attributes:
+    - `IS_DISPLAYED` : `str`
+    - `FILTER_DISPLAYED` : `str`
+    - `QUERY_ALL` : `str`
+    - `FIND_ALTERNATIVES` : `str`
+    - `TEXT` : `str`
+    - `DESCRIBE` : `str`
+    - `SNAPSHOT` : `str`
+    - `HIT_STATE` : `str`
+    - `OBSERVE` : `str`
+"""
+from __future__ import annotations
+
+from typing import Final
+
+IS_DISPLAYED: Final[str] = '''
+function isDisplayed(e) {
+    if (!e || !e.isConnected) return false;
+    var style = window.getComputedStyle(e);
+    return style.display !== 'none' && style.visibility !== 'hidden' &&
+           !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length);
+}
+'''
+
+FILTER_DISPLAYED: Final[str] = IS_DISPLAYED + '''
+return Array.prototype.filter.call(arguments[0], isDisplayed);
+'''
+
+QUERY_ALL: Final[str] = '''
+var UNEARTHTIME_BY = {
+    'class': function (root, q) { return root.querySelectorAll('.' + CSS.escape(q)); },
+    'css_selector': function (root, q) { return root.querySelectorAll(q); },
+    'id': function (root, q) { return root.querySelectorAll('[id="' + CSS.escape(q) + '"]'); },
+    'name': function (root, q) { return root.querySelectorAll('[name="' + CSS.escape(q) + '"]'); },
+    'tag': function (root, q) { return root.getElementsByTagName(q); },
+    'xpath': function (root, q) {
+        var result = document.evaluate(q, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null), elements = [];
+        for (var i = 0; i < result.snapshotLength; i++) elements.push(result.snapshotItem(i));
+        return elements;
+    }
+};
+
+function queryAll(root, query, by) {
+    try {
+        return Array.prototype.slice.call(UNEARTHTIME_BY[by](root, query));
+    } catch (e) {
+        return [];
+    }
+}
+'''
+
+FIND_ALTERNATIVES: Final[str] = IS_DISPLAYED + QUERY_ALL + '''
+function findAlternatives(root, alternatives, list, forced) {
+    var fallback = null;
+
+    for (var i = 0; i < alternatives.length; i++) {
+        var elements = queryAll(root, alternatives[i][0], alternatives[i][1]);
+
+        if (!list) elements = elements.slice(0, 1);
+        if (!elements.length) continue;
+
+        var shown = elements.filter(isDisplayed);
+
+        if (forced) return {index: i, matched: true, elements: elements, displayed: elements.map(isDisplayed)};
+        if (shown.length) return {index: i, matched: true, elements: shown, displayed: shown.map(function () { return true; })};
+        if (fallback === null) fallback = {index: i, matched: false, elements: elements, displayed: elements.map(function () { return false; })};
+    }
+
+    return fallback || {index: -1, matched: false, elements: [], displayed: []};
+}
+'''
+
+TEXT: Final[str] = '''
+function text(e) { return e ? e.textContent.replace(/\\s+/g, ' ').trim() : ''; }
+'''
+
+DESCRIBE: Final[str] = '''
+function describe(e) {
+    var attributes = {};
+
+    for (var i = 0; i < e.attributes.length; i++) attributes[e.attributes[i].name] = e.attributes[i].value;
+
+    if ('checked' in e) attributes.checked = e.checked ? 'true' : null;
+    if ('selected' in e) attributes.selected = e.selected ? 'true' : null;
+    if ('value' in e) attributes.value = e.value;
+    if (e.src) attributes.src = e.src;
+    if (e.href) attributes.href = e.href;
+
+    attributes.tagName = e.tagName;
+    attributes.innerText = (e.innerText || '').trim();
+
+    return attributes;
+}
+'''
+
+SNAPSHOT: Final[str] = FIND_ALTERNATIVES + DESCRIBE + '''
+return arguments[0].map(function (entry) {
+    var found = findAlternatives(document, entry[0], entry[1], entry[2]);
+    found.descriptions = found.elements.map(describe);
+    return found;
+});
+'''
+
+HIT_STATE: Final[str] = DESCRIBE + '''
+var display = arguments[1], prefetch = arguments[2];
+
+return Array.prototype.map.call(arguments[0], function (e) {
+    return [display ? e.style.display : null, prefetch ? describe(e) : null];
+});
+'''
+
+OBSERVE: Final[str] = FIND_ALTERNATIVES + '''
+var root = arguments[0] || document, alternatives = arguments[1], list = arguments[2], forced = arguments[3],
+    condition = arguments[4], timeout = arguments[5], callback = arguments[arguments.length - 1];
+var done = false, scheduled = false, observer = null, interval = null, timer = null;
+
+function holds(found) {
+    switch (condition) {
+        case 'present': return found.elements.length > 0;
+        case 'displayed': return found.matched && found.displayed.some(Boolean);
+        case 'hidden': return !found.displayed.some(Boolean);
+        case 'absent': return found.elements.length === 0;
+        default: return false;
+    }
+}
+
+function finish(result) {
+    if (done) return;
+    done = true;
+
+    if (observer) observer.disconnect();
+
+    clearInterval(interval);
+    clearTimeout(timer);
+    callback(result);
+}
+
+function check() {
+    scheduled = false;
+
+    var found = findAlternatives(root, alternatives, list, forced);
+
+    if (holds(found)) finish({satisfied: true, found: found});
+}
+
+check();
+
+if (!done) {
+    observer = new MutationObserver(function () {
+        if (!scheduled) {
+            scheduled = true;
+            Promise.resolve().then(check);
+        }
+    });
+
+    observer.observe(root === document ? document.documentElement : root, {childList: true, subtree: true, attributes: true, characterData: true});
+    interval = setInterval(check, 100);
+    timer = setTimeout(function () { finish({satisfied: false, found: null}); }, timeout);
+}
+'''
@@ -4,6 +4,9 @@ Waits created using the provided class are more compatible with the Unearthtime
 than the Selenium method shown [here](https://selenium-python.readthedocs.io/waits.html),
 under 'Custom Wait Conditions'. The 'locator' described in the link is NOT the same as the
 locator defined in this framework, though they have similar purposes.
+
+Waits created this way poll the DOM from Python. To wait on a `Locator` with a single
+in-page script instead, see `Locator.observe`.
 """
 
 from typing import Callable, Union
@@ -0,0 +1,271 @@
+"""The cache module defines a persistent cache for fetched images, keyed by URL.
+
+Entries are keyed by a hash of the URL and dimensions of an image, and stored as a body
+file alongside a small metadata file holding the validators the server sent with it.
+
+Attributes:
+    - `DEFAULT_MAX_BYTES`: `int` = 536870912
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Final, Union
+
+from .download import DEFAULT_RETRIES, DEFAULT_TIMEOUT, ConnectionPool
+from .._algae.exceptions import UnearthtimeException
+from .._algae.utils import raiseif
+
+DEFAULT_MAX_BYTES: Final[int] = 512 * 1024 * 1024
+
+_Body: Final[str] = '.bin'
+_Meta: Final[str] = '.json'
+_Reads: Final[int] = 3
+
+
+class ThumbnailCache:
+    """A size-bounded, least-recently-used cache of image bodies on disk.
+
+    Cached entries are revalidated with the server using their `ETag` and `Last-Modified`
+    headers, so an unchanged image costs a 304 response rather than a full download. In
+    offline mode the server is never contacted and only cached entries are served.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES, max_age: Union[float, int] = 0,
+                 offline: bool = False, pool: ConnectionPool = None, timeout: Union[float, int] = DEFAULT_TIMEOUT,
+                 retries: int = DEFAULT_RETRIES):
+        """
+        Parameters:
+            - `directory`: `str`
+            - `max_bytes`: `int` = 536870912
+            - `max_age`: `float`, `int` = 0
+            - `offline`: `bool` = `False`
+            - `pool`: `ConnectionPool` = `None`
+            - `timeout`: `float`, `int` = 30
+            - `retries`: `int` = 2
+
+        Notes:
+            - Entries fetched less than `max_age` seconds ago are served without revalidating.
+            - Existing entries in `directory` are picked up, least recently used first.
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        self.__directory = directory
+        self.__entries: OrderedDict[str, int] = OrderedDict()
+        self.__lock = Lock()
+        self.__max_age = max_age
+        self.__max_bytes = max_bytes
+        self.__offline = offline
+        self.__owned = pool is None
+        self.__pool = pool if pool is not None else ConnectionPool(timeout=timeout)
+        self.__retries = retries
+        self.__size = 0
+
+        bodies = [entry for entry in os.scandir(directory) if entry.is_file() and entry.name.endswith(_Body)]
+
+        for entry in sorted(bodies, key=lambda e: e.stat().st_mtime):
+            self.__entries[entry.name[:-len(_Body)]] = entry.stat().st_size
+            self.__size += entry.stat().st_size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    @property
+    def directory(self) -> str:
+        return self.__directory
+
+    @property
+    def offline(self) -> bool:
+        return self.__offline
+
+    @offline.setter
+    def offline(self, offline: bool):
+        self.__offline = offline
+
+    @property
+    def size(self) -> int:
+        """The total size in bytes of the cached bodies."""
+        return self.__size
+
+    def cached(self, url: str, width: int = 0, height: int = 0) -> bool:
+        """Whether or not an image is in the cache, valid or not."""
+        return ThumbnailCache.key(url, width, height) in self.__entries
+
+    @staticmethod
+    def key(url: str, width: int = 0, height: int = 0) -> str:
+        """The key of an image, a sha256 of its URL and dimensions rather than of its content."""
+        return hashlib.sha256(f'{url}|{width}x{height}'.encode()).hexdigest()
+
+    def clear(self):
+        """Removes every entry."""
+        with self.__lock:
+            for key in list(self.__entries):
+                self.__remove(key)
+
+    def close(self):
+        """Closes the connections of the cache, unless its pool was given to it."""
+        if self.__owned:
+            self.__pool.close()
+
+    def copy(self, url: str, path: str, width: int = 0, height: int = 0) -> str:
+        """Copies an image to `path`, fetching it into the cache first if needed.
+
+        Returns:
+            - `str`: `path`
+
+        Raises:
+            - `UnearthtimeException`: See `fetch`.
+        """
+        content = self.fetch(url, width, height)
+
+        with open(path, 'wb') as file:
+            file.write(content)
+
+        return path
+
+    def fetch(self, url: str, width: int = 0, height: int = 0) -> bytes:
+        """The body of an image, from the cache if it is still valid.
+
+        Parameters:
+            - `url`: `str`
+            - `width`: `int` = 0
+            - `height`: `int` = 0
+
+        Returns:
+            - `bytes`
+
+        Raises:
+            - `UnearthtimeException`: The image is not cached in offline mode, the request
+            failed, or it kept being evicted before it could be read.
+
+        Notes:
+            - An entry evicted by another thread between being found and being read is
+            treated as a miss and fetched again.
+        """
+        key = ThumbnailCache.key(url, width, height)
+
+        for _ in range(_Reads):
+            try:
+                with open(self.path(url, width, height), 'rb') as body:
+                    return body.read()
+            except FileNotFoundError:
+                self.__forget(key)
+
+        raise UnearthtimeException(f':[{url}]: Evicted from the cache before it could be read.')
+
+    def path(self, url: str, width: int = 0, height: int = 0) -> str:
+        """The path of the cached body of an image, fetching or revalidating it first if needed.
+
+        Raises:
+            - `UnearthtimeException`: The image is not cached in offline mode, or the request failed.
+        """
+        key = ThumbnailCache.key(url, width, height)
+        body = self.__file(key, _Body)
+        meta = self.__metadata(key) if key in self.__entries else None
+
+        if meta is not None and (self.__offline or time.time() - meta.get('fetched', 0) < self.__max_age):
+            self.__touch(key)
+            return body
+
+        raiseif(
+            self.__offline,
+            UnearthtimeException(f':[{url}]: Not cached and the cache is offline.')
+        )
+
+        headers = {}
+
+        if meta is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        status, message, content, _ = self.__pool.fetch(url, retries=self.__retries, headers=headers)
+
+        if status == 304 and meta is not None:
+            meta['fetched'] = time.time()
+            self.__write(key, _Meta, json.dumps(meta).encode())
+            self.__touch(key)
+
+            return body
+
+        raiseif(
+            status != 200,
+            UnearthtimeException(f':[{url}]: Responded with status {status}.')
+        )
+
+        self.__store(key, content, {
+            'url': url,
+            'width': width,
+            'height': height,
+            'etag': message.get('ETag'),
+            'last_modified': message.get('Last-Modified'),
+            'fetched': time.time()
+        })
+
+        return body
+
+    def __file(self, key: str, suffix: str) -> str:
+        return os.path.join(self.__directory, key + suffix)
+
+    def __forget(self, key: str):
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+
+    def __metadata(self, key: str) -> Union[Dict, None]:
+        try:
+            with open(self.__file(key, _Meta), 'r') as meta:
+                return json.load(meta)
+        except (OSError, ValueError):
+            return None
+
+    def __remove(self, key: str):
+        self.__size -= self.__entries.pop(key, 0)
+
+        for suffix in (_Body, _Meta):
+            try:
+                os.remove(self.__file(key, suffix))
+            except FileNotFoundError:
+                pass
+
+    def __store(self, key: str, content: bytes, meta: Dict):
+        self.__write(key, _Body, content)
+        self.__write(key, _Meta, json.dumps(meta).encode())
+
+        with self.__lock:
+            self.__size += len(content) - self.__entries.pop(key, 0)
+            self.__entries[key] = len(content)
+
+            while self.__size > self.__max_bytes and len(self.__entries) > 1:
+                self.__remove(next(iter(self.__entries)))
+
+    def __touch(self, key: str):
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+
+        try:
+            os.utime(self.__file(key, _Body))
+        except FileNotFoundError:
+            pass
+
+    def __write(self, key: str, suffix: str, content: bytes):
+        path = self.__file(key, suffix)
+        partial = f'{path}.{os.getpid()}.{id(content)}.part'
+
+        with open(partial, 'wb') as file:
+            file.write(content)
+
+        os.replace(partial, path)
@@ -0,0 +1,259 @@
+"""The download module defines a small pooled HTTP client for fetching images.
+
+Connections are kept alive and reused per host, so downloading many thumbnails from the
+same server only pays for the TCP and TLS handshakes once per worker.
+
+Attributes:
+    - `CHUNK_SIZE`: `int` = 65536
+    - `DEFAULT_RETRIES`: `int` = 2
+    - `DEFAULT_TIMEOUT`: `int` = 30
+    - `DEFAULT_WORKERS`: `int` = 8
+"""
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http.client import HTTPConnection, HTTPException, HTTPMessage, HTTPSConnection
+from threading import Lock
+from typing import BinaryIO, Dict, Final, Iterable, List, Tuple, Union
+from urllib.parse import urljoin, urlsplit
+
+from .._algae.exceptions import UnearthtimeException
+from .._algae.utils import raiseif
+
+CHUNK_SIZE: Final[int] = 65536
+DEFAULT_RETRIES: Final[int] = 2
+DEFAULT_TIMEOUT: Final[int] = 30
+DEFAULT_WORKERS: Final[int] = 8
+
+_MaxRedirects: Final[int] = 5
+_Redirects: Final[set] = {301, 302, 303, 307, 308}
+_Retryable: Final[set] = {429, 500, 502, 503, 504}
+
+ConnectionKey = Tuple[str, str, int]
+
+
+@dataclass
+class Download:
+    url: str
+    path: str
+    status: int
+    size: int
+    latency: float
+    attempts: int
+    headers: Union[HTTPMessage, None] = None
+    error: Union[Exception, None] = None
+
+    def __bool__(self): return self.error is None and self.status == 200
+
+    def __repr__(self): return f'{Download.__name__}(URL: {self.url}, Path: {self.path}, Status: {self.status}, Size: {self.size}, Latency: {self.latency}, Attempts: {self.attempts})'
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections, reused per scheme, host and port.
+
+    The pool is thread-safe. A connection is checked out for the whole of a request and
+    returned once its response has been read, so a pool shared by N threads holds at most
+    N connections per host.
+    """
+
+    def __init__(self, size: int = DEFAULT_WORKERS, timeout: Union[float, int] = DEFAULT_TIMEOUT):
+        """
+        Parameters:
+            - `size`: `int` = 8
+            - `timeout`: `float`, `int` = 30
+
+        Notes:
+            - `size` is the number of idle connections kept per host.
+        """
+        self.__idle: Dict[ConnectionKey, List[HTTPConnection]] = {}
+        self.__lock = Lock()
+        self.__size = max(1, size)
+        self.__timeout = timeout
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Closes every idle connection."""
+        with self.__lock:
+            idle, self.__idle = self.__idle, {}
+
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def fetch(self, url: str, sink: BinaryIO = None, retries: int = DEFAULT_RETRIES, headers: Dict[str, str] = None) -> Tuple[int, HTTPMessage, bytes, int]:
+        """Requests a url, retrying on connection errors and transient statuses.
+
+        Parameters:
+            - `url`: `str`
+            - `sink`: `BinaryIO` = `None`
+            - `retries`: `int` = 2
+            - `headers`: `{str: str}` = `None`
+
+        Returns:
+            - (`int`, `HTTPMessage`, `bytes`, `int`): The status, headers, body and number of attempts.
+
+        Raises:
+            - `UnearthtimeException`: Too many redirects, or every attempt failed.
+
+        Notes:
+            - If `sink` is given, a successful body is streamed to it in chunks and `b''` is
+            returned in its place.
+            - Redirects are followed and do not count as attempts.
+        """
+        attempt, redirects = 0, 0
+        start = sink.tell() if sink is not None else 0
+
+        while True:
+            attempt += 1
+
+            if sink is not None:
+                sink.seek(start)
+                sink.truncate()
+
+            try:
+                status, message, body, location = self.__request(url, sink, headers)
+            except (OSError, HTTPException) as e:
+                if attempt > retries:
+                    raise UnearthtimeException(f':[{url}]: Request failed after {attempt} attempts: {e}') from e
+
+                time.sleep(0.1 * 2 ** (attempt - 1))
+                continue
+
+            if status in _Redirects and location:
+                redirects += 1
+
+                raiseif(
+                    redirects > _MaxRedirects,
+                    UnearthtimeException(f':[{url}]: Too many redirects.')
+                )
+
+                url, attempt = urljoin(url, location), attempt - 1
+            elif status in _Retryable and attempt <= retries:
+                time.sleep(0.1 * 2 ** (attempt - 1))
+            else:
+                return status, message, body, attempt
+
+    def __acquire(self, key: ConnectionKey) -> HTTPConnection:
+        with self.__lock:
+            if connections := self.__idle.get(key):
+                return connections.pop()
+
+        scheme, host, port = key
+
+        if scheme == 'https':
+            return HTTPSConnection(host, port, timeout=self.__timeout)
+        else:
+            return HTTPConnection(host, port, timeout=self.__timeout)
+
+    def __release(self, key: ConnectionKey, connection: HTTPConnection):
+        with self.__lock:
+            connections = self.__idle.setdefault(key, [])
+
+            if len(connections) < self.__size:
+                connections.append(connection)
+                return
+
+        connection.close()
+
+    def __request(self, url: str, sink: Union[BinaryIO, None], headers: Union[Dict[str, str], None]):
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+
+        raiseif(
+            scheme not in ('http', 'https') or not parts.hostname,
+            UnearthtimeException(f':[{url}]: Invalid URL.')
+        )
+
+        key = (scheme, parts.hostname, parts.port or (443 if scheme == 'https' else 80))
+        target = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+        connection = self.__acquire(key)
+
+        try:
+            connection.request('GET', target, headers=headers or {})
+            response = connection.getresponse()
+
+            if response.status == 200 and sink is not None:
+                while chunk := response.read(CHUNK_SIZE):
+                    sink.write(chunk)
+
+                body = b''
+            else:
+                body = response.read()
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self.__release(key, connection)
+
+        return response.status, response.msg, body, response.getheader('Location')
+
+
+def download(url: str, path: str, pool: ConnectionPool, retries: int = DEFAULT_RETRIES) -> Download:
+    """Streams a url to a file, reporting how long it took.
+
+    Parameters:
+        - `url`: `str`
+        - `path`: `str`
+        - `pool`: `ConnectionPool`
+        - `retries`: `int` = 2
+
+    Returns:
+        - `Download`
+
+    Notes:
+        - The body is written to `path + '.part'` and only moved to `path` once complete,
+        so a failed download never leaves a truncated file behind.
+        - Errors are recorded on the result rather than raised.
+    """
+    partial = path + '.part'
+    start = time.perf_counter()
+
+    try:
+        with open(partial, 'wb') as sink:
+            status, message, _, attempts = pool.fetch(url, sink, retries)
+            size = sink.tell()
+
+        if status == 200:
+            os.replace(partial, path)
+            return Download(url, path, status, size, time.perf_counter() - start, attempts, message)
+        else:
+            os.remove(partial)
+            return Download(url, path, status, 0, time.perf_counter() - start, attempts, message,
+                            UnearthtimeException(f':[{url}]: Responded with status {status}.'))
+    except (OSError, UnearthtimeException) as e:
+        if os.path.exists(partial):
+            os.remove(partial)
+
+        return Download(url, path, 0, 0, time.perf_counter() - start, retries + 1, None, e)
+
+
+def download_all(urls: Iterable[str], paths: Iterable[str], workers: int = DEFAULT_WORKERS,
+                 timeout: Union[float, int] = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES) -> List[Download]:
+    """Downloads urls to paths concurrently over a shared `ConnectionPool`.
+
+    Parameters:
+        - `urls`: `Iterable[str]`
+        - `paths`: `Iterable[str]`
+        - `workers`: `int` = 8
+        - `timeout`: `float`, `int` = 30
+        - `retries`: `int` = 2
+
+    Returns:
+        - `[Download]`: In the order of `urls`.
+    """
+    jobs = list(zip(urls, paths))
+    workers = max(1, min(workers, len(jobs)))
+
+    with ConnectionPool(workers, timeout) as pool, ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda job: download(*job, pool, retries), jobs))
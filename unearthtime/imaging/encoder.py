@@ -0,0 +1,124 @@
+"""The encoder module defines a bounded pool that decodes and saves captures in the background.
+
+Attributes:
+    - `DEFAULT_WORKERS`: `int`
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+from typing import Callable, Final, Union
+
+from .image import Image
+from .._algae.exceptions import UnearthtimeException
+from .._algae.utils import raiseif
+
+DEFAULT_WORKERS: Final[int] = max(2, (os.cpu_count() or 2) // 2)
+
+_Default: Union[Encoder, None] = None
+_DefaultLock = Lock()
+
+
+class Encoder:
+    """A thread pool for decoding, converting and saving captures off the calling thread.
+
+    At most `max_pending` jobs may be queued or running at once. Submitting beyond that
+    blocks until a job finishes, so a fast capture loop cannot outrun encoding and hold an
+    unbounded number of frames in memory.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, max_pending: int = None):
+        """
+        Parameters:
+            - `workers`: `int`
+            - `max_pending`: `int` = `None`
+
+        Notes:
+            - If `max_pending` is `None`, it is twice `workers`.
+        """
+        raiseif(
+            workers < 1,
+            UnearthtimeException(f':[{workers}]: Expected at least one worker.')
+        )
+
+        self.__executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='unearthtime-encoder')
+        self.__max_pending = max(workers, max_pending) if max_pending is not None else workers * 2
+        self.__slots = BoundedSemaphore(self.__max_pending)
+        self.__workers = workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    @property
+    def max_pending(self) -> int:
+        return self.__max_pending
+
+    @property
+    def workers(self) -> int:
+        return self.__workers
+
+    def save(self, image: Union[bytes, Image], fp: str, color_space: str = 'RGB', format_=None, **params) -> Future:
+        """Decodes, if needed, and saves an image in the background.
+
+        Parameters:
+            - `image`: `bytes`, `Image`
+            - `fp`: `str`
+            - `color_space`: `str` = 'RGB'
+            - `format_` = None
+            - `**params`
+
+        Returns:
+            - `Future`: Resolves to `fp` once saved.
+
+        Notes:
+            - `bytes` are decoded with `Image.decode` on the worker, so passing the png of a
+            screenshot keeps all the pixel work off the calling thread.
+        """
+        return self.submit(Encoder.__save, image, fp, color_space, format_, params)
+
+    def shutdown(self, wait: bool = True):
+        self.__executor.shutdown(wait)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Runs `fn` on a worker, blocking first if `max_pending` jobs are outstanding.
+
+        Returns:
+            - `Future`
+        """
+        self.__slots.acquire()
+
+        try:
+            future = self.__executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self.__slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self.__slots.release())
+
+        return future
+
+    @staticmethod
+    def __save(image: Union[bytes, Image], fp: str, color_space: str, format_, params: dict) -> str:
+        if not isinstance(image, Image):
+            image = Image.decode(image, color_space)
+        elif color_space and image.color_space != color_space.upper():
+            image = image.with_color_space(color_space)
+
+        image.save(fp, format_, **params)
+
+        return fp
+
+
+def default_encoder() -> Encoder:
+    """The `Encoder` shared by asynchronous saves that are not given one."""
+    global _Default
+
+    with _DefaultLock:
+        if _Default is None:
+            _Default = Encoder()
+
+        return _Default
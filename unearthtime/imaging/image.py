@@ -1,22 +1,27 @@
 from __future__ import annotations
 
+import hashlib
+import os
 from binascii import a2b_base64
 from collections import namedtuple
 from enum import Enum
 from http.client import HTTPMessage
 from io import BytesIO
-from typing import Any, Dict, Tuple, Final, Union
+from typing import Any, Dict, Iterable, List, Tuple, Final, Union
 from urllib import request
+from urllib.parse import parse_qs, urlsplit
 
 import cv2 as cv
 import imutils as im
 from PIL import Image as PILImage
 from PIL.PngImagePlugin import PngImageFile, PngInfo
-from numpy import array, ndarray
+from numpy import array, ascontiguousarray, float32, frombuffer, median, ndarray, packbits, uint8
 from skimage import io as skio
 from skimage.metrics import mean_squared_error as mse
 from skimage.metrics import structural_similarity as ssim
 
+from .cache import ThumbnailCache
+from .download import DEFAULT_RETRIES, DEFAULT_TIMEOUT, DEFAULT_WORKERS, ConnectionPool, Download, download_all
 from .._algae.warnings import overriding, overridinginvalidinput
 from .._algae.exceptions import UnearthtimeException
 from .._algae.strings import ismalformedurl, noneorempty
@@ -31,6 +36,13 @@ DimensionType = Union[int, float, 'AspectRatio']
 
 Dimension = namedtuple('Dimension', ['width', 'height'])
 
+_Reductions: Final[Dict[int, Tuple[int, int]]] = {
+    1: (cv.IMREAD_COLOR, cv.IMREAD_GRAYSCALE),
+    2: (cv.IMREAD_REDUCED_COLOR_2, cv.IMREAD_REDUCED_GRAYSCALE_2),
+    4: (cv.IMREAD_REDUCED_COLOR_4, cv.IMREAD_REDUCED_GRAYSCALE_4),
+    8: (cv.IMREAD_REDUCED_COLOR_8, cv.IMREAD_REDUCED_GRAYSCALE_8)
+}
+
 
 class AspectRatio(Enum):
     """The width to height ratio of an image."""
@@ -121,6 +133,140 @@ class Thumbnail:
         self.__url = url
         self.__dim = dimension
 
+    @classmethod
+    def from_url(cls, url: str, default: Dimension = None, strict: bool = True) -> Union[Thumbnail, None]:
+        """Creates a thumbnail with dimensions parsed from the `width` and `height` of the url query.
+
+        Parameters:
+            - `url` : `str`
+            - `default` : `Dimension` = None
+            - `strict` : `bool` = True
+
+        Returns:
+            - `Thumbnail`, `None`
+
+        Raises:
+            - `UnearthtimeException` : Invalid `url`, or no dimensions in the url and no `default`.
+
+        Notes:
+            - If `strict` is `False`, `None` is returned instead of raising.
+        """
+        if not strict:
+            try:
+                return cls.from_url(url, default)
+            except UnearthtimeException:
+                return None
+
+        query = parse_qs(urlsplit(url).query) if not noneorempty(url) else {}
+
+        try:
+            dim = Dimension(int(query['width'][0]), int(query['height'][0]))
+        except (KeyError, IndexError, ValueError):
+            raiseif(
+                default is None,
+                UnearthtimeException(':[%s]: No thumbnail dimensions in URL.' % url)
+            )
+
+            dim = default
+
+        return cls(url, dim)
+
+    @staticmethod
+    def download_many(thumbnails: Iterable[Thumbnail], directory: str, workers: int = DEFAULT_WORKERS,
+                      names: Iterable[str] = None, timeout: Union[float, int] = DEFAULT_TIMEOUT,
+                      retries: int = DEFAULT_RETRIES) -> List[Download]:
+        """Downloads many thumbnails concurrently, reusing keep-alive connections.
+
+        Parameters:
+            - `thumbnails` : `Iterable[Thumbnail]`
+            - `directory` : `str`
+            - `workers` : `int` = 8
+            - `names` : `Iterable[str]` = None
+            - `timeout` : `float`, `int` = 30
+            - `retries` : `int` = 2
+
+        Returns:
+            - `[Download]`: In the order of `thumbnails`, each with its status and latency.
+
+        Notes:
+            - If `names` is `None`, files are named by their index, e.g. '0.png'.
+            - Each thumbnail that downloads successfully has its `png` set, as with `download_png`.
+            - Failed downloads are reported on their `Download` rather than raised.
+        """
+        thumbnails = list(thumbnails)
+        names = list(names) if names is not None else [f'{i}.png' for i in range(len(thumbnails))]
+
+        raiseif(
+            len(names) != len(thumbnails),
+            UnearthtimeException(f'Expected {len(thumbnails)} names, got {len(names)}.')
+        )
+
+        os.makedirs(directory, exist_ok=True)
+
+        downloads = download_all(
+            (thumbnail.url for thumbnail in thumbnails),
+            [os.path.join(directory, name) for name in names],
+            workers, timeout, retries)
+
+        for thumbnail, result in zip(thumbnails, downloads):
+            if result:
+                thumbnail.__png = (result.path, result.headers)
+
+        return downloads
+
+    def fetch_image(self, color_space: str = 'RGB', reduce: int = 1, timeout: Union[float, int] = DEFAULT_TIMEOUT,
+                    retries: int = DEFAULT_RETRIES, pool: ConnectionPool = None, cache: ThumbnailCache = None) -> Image:
+        """Downloads the thumbnail into memory and decodes it, without touching disk.
+
+        Parameters:
+            - `color_space` : `str` = 'RGB'
+            - `reduce` : `int` = 1
+            - `timeout` : `float`, `int` = 30
+            - `retries` : `int` = 2
+            - `pool` : `ConnectionPool` = None
+            - `cache` : `ThumbnailCache` = None
+
+        Returns:
+            - `Image`
+
+        Raises:
+            - `UnearthtimeException` : Invalid `reduce`, the request failed, or the body is not an image.
+
+        Notes:
+            - `reduce` is one of 1, 2, 4 or 8, and decodes the image at that fraction of its
+            size, which is faster than decoding it fully and resizing.
+            - Pass a shared `pool` to reuse connections across many thumbnails.
+            - If a `cache` is given, the body is read through it, and `timeout`, `retries`
+            and `pool` are those of the cache.
+        """
+        raiseif(
+            reduce not in _Reductions,
+            UnearthtimeException(f':[{reduce}]: Invalid reduction, expected one of {sorted(_Reductions)}.')
+        )
+
+        if cache is not None:
+            status, body = 200, cache.fetch(self.__url, self.width, self.height)
+        elif pool is None:
+            with ConnectionPool(1, timeout) as pool:
+                status, _, body, _ = pool.fetch(self.__url, retries=retries)
+        else:
+            status, _, body, _ = pool.fetch(self.__url, retries=retries)
+
+        raiseif(
+            status != 200,
+            UnearthtimeException(f':[{self.__url}]: Responded with status {status}.')
+        )
+
+        gray = color_space.upper() in ('GRAY', 'GREY')
+        image = cv.imdecode(frombuffer(body, uint8), _Reductions[reduce][gray])
+
+        raiseif(
+            image is None,
+            UnearthtimeException(f':[{self.__url}]: Could not decode image.')
+        )
+
+        return Image(image, 'GRAY' if gray else 'BGR', color_space)
+
     @property
     def height(self) -> int:
         """The height of the image"""
@@ -145,17 +291,24 @@ class Thumbnail:
         """The width of the thumbnail."""
         return self.__dim.width
 
-    def download_png(self, path: str) -> Tuple[str, HTTPMessage]:
+    def download_png(self, path: str, cache: ThumbnailCache = None) -> Tuple[str, Union[HTTPMessage, None]]:
         """Downloads the thumbnail as a png.
 
         Parameters:
             - `path` : `str`
+            - `cache` : `ThumbnailCache` = None
 
         Returns:
             - (`str`, `http.client.HTTPMessage`)
+
+        Notes:
+            - If a `cache` is given, the png is copied from it, and the message is `None`.
         """
         if (self.__png is None or self.__png[0] != path) and not noneorempty(path):
-            self.__png = request.urlretrieve(self.__url, path)
+            if cache is not None:
+                self.__png = (cache.copy(self.__url, path, self.width, self.height), None)
+            else:
+                self.__png = request.urlretrieve(self.__url, path)
 
         return self.__png
 
@@ -169,7 +322,7 @@ class Image:
         )
 
         self.__image, self.__color_space = Image.__resolve_image(image, from_color_space, to_color_space)
-        self.__hash = 0
+        self.__hash = None
         self.__height, self.__width = image.shape[0], image.shape[1]
         self.__info = PngInfo()
 
@@ -181,8 +334,9 @@ class Image:
             return getattr(self.__image, attr)
 
     def __hash__(self):
-        if not self.__hash:
-            self.__hash = hash((self.__image.data.toreadonly, self.__image.sum(), self.__color_space, self.__width, self.__height))
+        if self.__hash is None:
+            digest = hashlib.blake2b(ascontiguousarray(self.__image).data, digest_size=16).digest()
+            self.__hash = hash((digest, self.__image.shape, self.__image.dtype.str, self.__color_space))
 
         return self.__hash
 
@@ -206,6 +360,7 @@ class Image:
 
     def __delitem__(self, value, /):
         self.__image.__delitem__(value)
+        self.__hash = None
 
     def __divmod__(self, value, /):
         d, m = self.__image.__divmod__(value)
@@ -231,30 +386,37 @@ class Image:
 
     def __iadd__(self, value, /):
         self.__image.__iadd__(value)
+        self.__hash = None
         return self
 
     def __iand__(self, value, /):
         self.__image.__iand__(value)
+        self.__hash = None
         return self
 
     def __ifloordiv__(self, value, /):
         self.__image.__ifloordiv__(value)
+        self.__hash = None
         return self
 
     def __ilshift__(self, value, /):
         self.__image.__ilshift__(value)
+        self.__hash = None
         return self
 
     def __imatmul__(self, value, /):
         self.__image.__imatmul__(value)
+        self.__hash = None
         return self
 
     def __imod__(self, value, /):
         self.__image.__imod__(value)
+        self.__hash = None
         return self
 
     def __imul__(self, value, /):
         self.__image.__imul__(value)
+        self.__hash = None
         return self
 
     def __index__(self):
@@ -268,18 +430,22 @@ class Image:
 
     def __ior__(self, value, /):
         self.__image.__ior__(value)
+        self.__hash = None
         return self
 
     def __ipow__(self, value, /):
         self.__image.__ipow__(value)
+        self.__hash = None
         return self
 
     def __irshift__(self, value, /):
         self.__image.__irshift__(value)
+        self.__hash = None
         return self
 
     def __isub__(self, value, /):
         self.__image.__isub__(value)
+        self.__hash = None
         return self
 
     def __iter__(self):
@@ -287,10 +453,12 @@ class Image:
 
     def __itruediv__(self, value, /):
         self.__image.__itruediv__(value)
+        self.__hash = None
         return self
 
     def __ixor__(self, value, /):
         self.__image.__ixor__(value)
+        self.__hash = None
         return self
 
     def __len__(self):
@@ -377,7 +545,7 @@ class Image:
 
     def __setitem__(self, value, /):
         self.__image.__setitem__(value)
-        self.__hash = 0
+        self.__hash = None
 
     def __sizeof__(self):
         return self.__image.__sizeof__()
@@ -395,6 +563,50 @@ class Image:
     def from_base64(cls, base64: str, to_color_space: str = 'RGBA'):
         return cls(array(PILImage.open(BytesIO(a2b_base64(base64)))), 'RGBA', to_color_space)
 
+    @classmethod
+    def decode(cls, bytes_: bytes, to_color_space: str = 'RGBA'):
+        """Decodes encoded image bytes, e.g. a png, straight into an `Image`.
+
+        The bytes are decoded with `cv.imdecode` from a view over them, and swapped into the
+        requested channel order in place where possible, so no intermediate `PIL` image or
+        extra arrays are made.
+
+        Parameters:
+            - `bytes_` : `bytes`
+            - `to_color_space` : `str` = 'RGBA'
+
+        Returns:
+            - `Image`
+
+        Raises:
+            - `UnearthtimeException` : The bytes could not be decoded.
+
+        Notes:
+            - 'GRAY' is decoded in color and then converted, as `from_bytes` does, since
+            `cv.IMREAD_GRAYSCALE` rounds differently and would change the pixels.
+        """
+        tcs = to_color_space.upper()
+
+        if tcs in ('BGR', 'RGB', 'GRAY', 'GREY'):
+            flags = cv.IMREAD_COLOR
+        else:
+            flags = cv.IMREAD_UNCHANGED
+
+        image = cv.imdecode(frombuffer(bytes_, uint8), flags)
+
+        raiseif(
+            image is None,
+            UnearthtimeException('Could not decode image.')
+        )
+
+        fcs = 'GRAY' if image.ndim == 2 else 'BGRA' if image.shape[2] == 4 else 'BGR'
+
+        if (fcs, tcs) in (('BGR', 'RGB'), ('BGRA', 'RGBA')):
+            cv.cvtColor(image, cv.COLOR_BGR2RGB if fcs == 'BGR' else cv.COLOR_BGRA2RGBA, dst=image)
+            fcs = tcs
+
+        return cls(image, fcs, tcs)
+
     @classmethod
     def from_bytes(cls, bytes_: bytes, to_color_space: str = 'RGBA'):
         return cls(array(PILImage.open(BytesIO(bytes_))), 'RGBA', to_color_space)
@@ -410,6 +622,40 @@ class Image:
 
         return im
 
+    @classmethod
+    def from_raw(cls, buffer: Union[bytes, bytearray, memoryview], width: int, height: int, channels: int = 4,
+                 flipped: bool = False, from_color_space: str = 'RGBA', to_color_space: str = None):
+        """Wraps raw 8-bit pixels in an `Image` without copying them.
+
+        Parameters:
+            - `buffer` : `bytes`, `bytearray`, `memoryview`
+            - `width` : `int`
+            - `height` : `int`
+            - `channels` : `int` = 4
+            - `flipped` : `bool` = False
+            - `from_color_space` : `str` = 'RGBA'
+            - `to_color_space` : `str` = None
+
+        Returns:
+            - `Image`
+
+        Raises:
+            - `UnearthtimeException` : The size of `buffer` does not match the dimensions.
+
+        Notes:
+            - If `flipped`, rows are bottom-up, as read from WebGL, and are reversed with a view.
+            - Unless a conversion is needed, the array is a view over `buffer`, and is read-only
+            if `buffer` is `bytes`. Use `copy` for a writable image.
+        """
+        raiseif(
+            len(buffer) != width * height * channels,
+            UnearthtimeException(f'Expected {width * height * channels} bytes for a {width}x{height}x{channels} image, got {len(buffer)}.')
+        )
+
+        image = frombuffer(buffer, uint8).reshape((height, width, channels) if channels > 1 else (height, width))
+
+        return cls(image[::-1] if flipped else image, from_color_space, to_color_space)
+
     @classmethod
     def read_file(cls, fp: str, flags=None, to_color_space: str = 'BGR'):
         return cls(cv.imread(fp, flags), 'BGR', to_color_space=to_color_space)
@@ -427,6 +673,12 @@ class Image:
 
     @property
     def array(self):
+        """The pixels of this image.
+
+        Notes:
+            - The hash of this image is cached, so changes made to this array directly, rather
+            than through `Image`, are not reflected by `hash`.
+        """
         return self.__image
 
     @property
@@ -453,9 +705,25 @@ class Image:
     def as_image(self):
         return PILImage.fromarray(self.__image)
 
+    def average_hash(self, size: int = 8) -> int:
+        """A perceptual hash of `size` squared bits, set where a pixel is brighter than the mean.
+
+        Parameters:
+            - `size` : `int` = 8
+
+        Returns:
+            - `int`
+
+        Notes:
+            - Compare hashes with `imaging.index.hamming`.
+        """
+        small = cv.resize(self.__gray(), (size, size), interpolation=cv.INTER_AREA)
+
+        return Image.__pack(small > small.mean())
+
     def change_color_space(self, color_space: str):
         self.__image, self.__color_space = Image.__resolve_image(self.__image, self.__color_space, color_space)
-        self.__hash = 0
+        self.__hash = None
 
     def compare_full(self, img: Image, rect_color: RGBColor = (0, 0, 255), line_thickness=1, line_type=cv.LINE_8):
         cim1, cim2 = self.with_color_space('BGR'), img.with_color_space('BGR')
@@ -491,8 +759,43 @@ class Image:
     def copy(self):
         return self.__copy__()
 
+    def difference_hash(self, size: int = 8) -> int:
+        """A perceptual hash of `size` squared bits, set where a pixel is brighter than its left neighbour.
+
+        Parameters:
+            - `size` : `int` = 8
+
+        Returns:
+            - `int`
+        """
+        small = cv.resize(self.__gray(), (size + 1, size), interpolation=cv.INTER_AREA)
+
+        return Image.__pack(small[:, 1:] > small[:, :-1])
+
     def draw_rectangle(self, pt1, pt2, color: RGBColor = (0, 0, 255), line_thickness: int = 1, line_type: int = cv.LINE_8):
         cv.rectangle(self.__image, pt1, pt2, color, line_thickness, line_type)
+        self.__hash = None
+
+    def perceptual_hash(self, size: int = 8, factor: int = 4) -> int:
+        """A perceptual hash of `size` squared less one bits from the low frequencies of a discrete cosine transform.
+
+        Parameters:
+            - `size` : `int` = 8
+            - `factor` : `int` = 4
+
+        Returns:
+            - `int`
+
+        Notes:
+            - The image is shrunk to `size * factor` pixels square before the transform. The DC
+            term, the mean brightness, is dropped, and a bit is set for each remaining coefficient
+            above their median.
+        """
+        side = size * factor
+        small = cv.resize(self.__gray(), (side, side), interpolation=cv.INTER_AREA).astype(float32)
+        coefficients = cv.dct(small)[:size, :size].ravel()[1:]
+
+        return Image.__pack(coefficients > median(coefficients))
 
     def save(self, fp: str, format_=None, pnginfo=None, **params):
         if (format_ and format_.lower() == 'png') or (fp and fp.endswith('.png')):
@@ -519,6 +822,21 @@ class Image:
     def with_color_space(self, color_space: str):
         return Image(self.__image.copy(), self.__color_space, color_space)
 
+    def __gray(self) -> ndarray:
+        if self.__color_space == 'GRAY':
+            return self.__image
+
+        try:
+            return cv.cvtColor(self.__image, getattr(cv, f'COLOR_{self.__color_space}2GRAY'))
+        except AttributeError:
+            return cv.cvtColor(self.with_color_space('BGR').array, cv.COLOR_BGR2GRAY)
+
+    @staticmethod
+    def __pack(bits: ndarray) -> int:
+        bits = bits.ravel()
+
+        return int.from_bytes(packbits(bits).tobytes(), 'big') >> (-len(bits) % 8)
+
     @staticmethod
     def __resolve_image(image: ndarray, from_color_space: str, to_color_space: str):
         if from_color_space is not None:
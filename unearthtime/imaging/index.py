@@ -0,0 +1,145 @@
+"""The index module defines an in-memory index of perceptual hashes for finding near-duplicate images.
+
+Attributes:
+    - `HashMethods`: `{str}`
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Final, Iterator, List, Tuple, Union
+
+from .image import Image
+from .._algae.exceptions import UnearthtimeException
+from .._algae.utils import raiseif
+
+HashMethods: Final[set] = {'average', 'difference', 'perceptual'}
+
+
+def hamming(a: int, b: int) -> int:
+    """The number of bits that differ between two hashes."""
+    return bin(a ^ b).count('1')
+
+
+class _Node:
+    __slots__ = ('hash', 'values', 'children')
+
+    def __init__(self, hash_: int, value: Any):
+        self.hash = hash_
+        self.values = [value]
+        self.children: Dict[int, _Node] = {}
+
+
+class HashIndex:
+    """A BK-tree of perceptual hashes, searchable by Hamming distance.
+
+    Hashes are placed by their distance to each node on the way down, so a search within a
+    radius only visits children whose distance lies within that radius of the query's, by
+    the triangle inequality, rather than comparing against every hash.
+    """
+
+    def __init__(self, method: str = 'difference', size: int = 8):
+        """
+        Parameters:
+            - `method`: `str` = 'difference'
+            - `size`: `int` = 8
+
+        Raises:
+            - `UnearthtimeException`: Invalid `method`.
+
+        Notes:
+            - `method` is one of 'average', 'difference' or 'perceptual', and selects the
+            `Image` hash used when images rather than hashes are given.
+        """
+        raiseif(
+            method not in HashMethods,
+            UnearthtimeException(f':[{method}]: Invalid hash method, expected one of {sorted(HashMethods)}.')
+        )
+
+        self.__len = 0
+        self.__method = method
+        self.__root = None
+        self.__size = size
+
+    def __contains__(self, key: Union[int, Image]):
+        return bool(self.search(key, 0))
+
+    def __iter__(self) -> Iterator[Tuple[int, Any]]:
+        stack = [self.__root] if self.__root else []
+
+        while stack:
+            node = stack.pop()
+            stack.extend(node.children.values())
+
+            for value in node.values:
+                yield node.hash, value
+
+    def __len__(self):
+        return self.__len
+
+    @property
+    def method(self) -> str:
+        return self.__method
+
+    def add(self, key: Union[int, Image], value: Any = None) -> int:
+        """Adds a hash, or the hash of an image, with an associated value.
+
+        Returns:
+            - `int`: The hash that was added.
+        """
+        hash_ = self.hash(key)
+        self.__len += 1
+
+        if self.__root is None:
+            self.__root = _Node(hash_, value)
+            return hash_
+
+        node = self.__root
+
+        while True:
+            distance = hamming(hash_, node.hash)
+
+            if distance == 0:
+                node.values.append(value)
+                return hash_
+            elif distance in node.children:
+                node = node.children[distance]
+            else:
+                node.children[distance] = _Node(hash_, value)
+                return hash_
+
+    def hash(self, key: Union[int, Image]) -> int:
+        """The hash of an image by the method of this index, or `key` itself if it is a hash."""
+        if isinstance(key, Image):
+            return getattr(key, f'{self.__method}_hash')(self.__size)
+        else:
+            return int(key)
+
+    def nearest(self, key: Union[int, Image], radius: int) -> Union[Tuple[int, int, Any], None]:
+        """The closest entry within `radius` bits, as (distance, hash, value), or `None`."""
+        found = self.search(key, radius)
+
+        return found[0] if found else None
+
+    def search(self, key: Union[int, Image], radius: int) -> List[Tuple[int, int, Any]]:
+        """Every entry within `radius` bits of a hash, or the hash of an image.
+
+        Returns:
+            - `[(int, int, Any)]`: (distance, hash, value), closest first.
+        """
+        hash_ = self.hash(key)
+        found = []
+        stack = [self.__root] if self.__root else []
+
+        while stack:
+            node = stack.pop()
+            distance = hamming(hash_, node.hash)
+
+            if distance <= radius:
+                found.extend((distance, node.hash, value) for value in node.values)
+
+            for child_distance, child in node.children.items():
+                if distance - radius <= child_distance <= distance + radius:
+                    stack.append(child)
+
+        found.sort(key=lambda entry: entry[0])
+
+        return found
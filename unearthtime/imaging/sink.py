@@ -0,0 +1,320 @@
+"""The sink module defines destinations for frames captured from a timeline.
+
+A sink is opened with the number of frames to expect, written to by index, and closed once
+every frame has been written. Sinks that can only be written in order, such as videos,
+say so with `ordered`; writes to the others may arrive in any order and from any thread.
+
+Attributes:
+    - `DEFAULT_MAX_BUFFERED`: `int` = 16
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Dict, Final, Tuple, Union
+
+import cv2 as cv
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from .image import Image
+from .._algae.exceptions import UnearthtimeException
+from .._algae.utils import raiseif
+
+DEFAULT_MAX_BUFFERED: Final[int] = 16
+
+
+class Sink(ABC):
+    ordered: bool = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self, count: int):
+        """Prepares the sink for `count` frames."""
+        pass
+
+    @abstractmethod
+    def write(self, index: int, image: Image): pass
+
+    def close(self):
+        """Flushes the sink once every frame has been written."""
+        pass
+
+
+class DirectorySink(Sink):
+    """Saves each frame as its own file in a directory."""
+    ordered = False
+
+    def __init__(self, directory: str, pattern: str = '{index:05d}.png', format_=None, **params):
+        """
+        Parameters:
+            - `directory`: `str`
+            - `pattern`: `str` = '{index:05d}.png'
+            - `format_` = None
+            - `**params`: Passed to `Image.save`.
+        """
+        self.__directory = directory
+        self.__format = format_
+        self.__params = params
+        self.__pattern = pattern
+
+    @property
+    def directory(self) -> str:
+        return self.__directory
+
+    def open(self, count: int):
+        os.makedirs(self.__directory, exist_ok=True)
+
+    def write(self, index: int, image: Image):
+        image.save(os.path.join(self.__directory, self.__pattern.format(index=index)), self.__format, **self.__params)
+
+
+class ArraySink(Sink):
+    """Stacks frames into a single `(count, height, width[, channels])` array.
+
+    The stack is kept in memory, memory-mapped to a '.npy' file, or saved compressed to a
+    '.npz' file on close, depending on `path`.
+    """
+    ordered = False
+
+    def __init__(self, path: str = None):
+        """
+        Parameters:
+            - `path`: `str` = `None`
+
+        Notes:
+            - A `path` ending in '.npy' is memory-mapped, so frames are written straight to disk.
+            - A `path` ending in '.npz' is saved with `numpy.savez_compressed` under 'frames'.
+            - If `path` is `None`, the stack is only kept in memory.
+        """
+        raiseif(
+            path is not None and not path.endswith(('.npy', '.npz')),
+            UnearthtimeException(f':[{path}]: Expected a .npy or .npz path.')
+        )
+
+        self.__array = None
+        self.__count = 0
+        self.__lock = Lock()
+        self.__path = path
+
+    @property
+    def array(self) -> Union[np.ndarray, None]:
+        return self.__array
+
+    def open(self, count: int):
+        self.__array = None
+        self.__count = count
+
+    def write(self, index: int, image: Image):
+        frame = image.array
+
+        with self.__lock:
+            if self.__array is None:
+                shape = (self.__count,) + frame.shape
+
+                if self.__path is not None and self.__path.endswith('.npy'):
+                    self.__array = open_memmap(self.__path, mode='w+', dtype=frame.dtype, shape=shape)
+                else:
+                    self.__array = np.empty(shape, frame.dtype)
+
+        raiseif(
+            frame.shape != self.__array.shape[1:],
+            UnearthtimeException(f':[{index}]: Frame of shape {frame.shape} does not match {self.__array.shape[1:]}.')
+        )
+
+        self.__array[index] = frame
+
+    def close(self):
+        if self.__array is None:
+            return
+        elif isinstance(self.__array, np.memmap):
+            self.__array.flush()
+        elif self.__path is not None:
+            np.savez_compressed(self.__path, frames=self.__array)
+
+
+class VideoSink(Sink):
+    """Encodes frames, in order, into a video with `cv.VideoWriter`."""
+    ordered = True
+
+    def __init__(self, path: str, fps: float = 10.0, fourcc: str = 'mp4v'):
+        """
+        Parameters:
+            - `path`: `str`
+            - `fps`: `float` = 10.0
+            - `fourcc`: `str` = 'mp4v'
+        """
+        self.__fourcc = fourcc
+        self.__fps = fps
+        self.__path = path
+        self.__writer = None
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def write(self, index: int, image: Image):
+        frame = image.array if image.color_space == 'BGR' else image.with_color_space('BGR').array
+
+        if self.__writer is None:
+            self.__writer = cv.VideoWriter(self.__path, cv.VideoWriter_fourcc(*self.__fourcc), self.__fps,
+                                           (frame.shape[1], frame.shape[0]))
+
+            raiseif(
+                not self.__writer.isOpened(),
+                UnearthtimeException(f':[{self.__path}]: Could not open video for writing.')
+            )
+
+        self.__writer.write(np.ascontiguousarray(frame))
+
+    def close(self):
+        if self.__writer is not None:
+            self.__writer.release()
+            self.__writer = None
+
+
+class ReorderSink(Sink):
+    """Passes frames that arrive out of order on to another sink in order.
+
+    Frames are buffered until every frame before them has been written, so a sink that must
+    be written in order, e.g. a `VideoSink`, can be fed from several sessions at once.
+
+    At most `max_buffered` frames are held in memory. Frames that arrive beyond that are
+    spilled uncompressed to `directory` and read back when their turn comes, so memory stays
+    bounded however far ahead of the next frame the writers get, without blocking them.
+    """
+    ordered = False
+
+    def __init__(self, sink: Sink, max_buffered: int = DEFAULT_MAX_BUFFERED, directory: str = None):
+        """
+        Parameters:
+            - `sink`: `Sink`
+            - `max_buffered`: `int` = 16
+            - `directory`: `str` = `None`
+
+        Notes:
+            - If `directory` is `None`, a temporary directory is made on the first spill and
+            removed on close.
+            - Spilled frames take as much disk as they would memory, so writers should still
+            be kept close to the next frame, e.g. by dealing frames out round-robin.
+        """
+        raiseif(
+            max_buffered < 0,
+            UnearthtimeException(f':[{max_buffered}]: Expected a non-negative buffer size.')
+        )
+
+        self.__buffer: Dict[int, Image] = {}
+        self.__directory = directory
+        self.__lock = Lock()
+        self.__max_buffered = max_buffered
+        self.__next = 0
+        self.__sink = sink
+        self.__spill = None
+        self.__spilled: Dict[int, Tuple[str, str]] = {}
+
+    @property
+    def buffered(self) -> int:
+        """The number of frames waiting on an earlier frame, in memory or spilled."""
+        return len(self.__buffer) + len(self.__spilled)
+
+    @property
+    def spilled(self) -> int:
+        """The number of frames waiting on an earlier frame on disk."""
+        return len(self.__spilled)
+
+    def open(self, count: int):
+        self.__buffer = {}
+        self.__next = 0
+        self.__spilled = {}
+        self.__sink.open(count)
+
+    def write(self, index: int, image: Image):
+        with self.__lock:
+            if index != self.__next and len(self.__buffer) >= self.__max_buffered:
+                self.__spilled[index] = (self.__save(index, image), image.color_space)
+            else:
+                self.__buffer[index] = image
+
+            while self.__next in self.__buffer or self.__next in self.__spilled:
+                self.__sink.write(self.__next, self.__take(self.__next))
+                self.__next += 1
+
+    def close(self):
+        try:
+            with self.__lock:
+                for index in sorted(set(self.__buffer) | set(self.__spilled)):
+                    self.__sink.write(index, self.__take(index))
+        finally:
+            if self.__spill is not None:
+                shutil.rmtree(self.__spill, ignore_errors=True)
+                self.__spill = None
+
+            self.__sink.close()
+
+    def __save(self, index: int, image: Image) -> str:
+        if self.__spill is None:
+            if self.__directory is None:
+                self.__spill = tempfile.mkdtemp(prefix='unearthtime-reorder-')
+            else:
+                os.makedirs(self.__directory, exist_ok=True)
+                self.__spill = tempfile.mkdtemp(prefix='reorder-', dir=self.__directory)
+
+        path = os.path.join(self.__spill, f'{index}.npy')
+        np.save(path, image.array, allow_pickle=False)
+
+        return path
+
+    def __take(self, index: int) -> Image:
+        if index in self.__buffer:
+            return self.__buffer.pop(index)
+
+        path, color_space = self.__spilled.pop(index)
+        image = Image(np.load(path), color_space, color_space)
+        os.remove(path)
+
+        return image
+
+
+class ShardSink(Sink):
+    """Every `stride`th position of another sink, starting at `offset`.
+
+    Opening and closing are left to the owner of the wrapped sink.
+    """
+
+    def __init__(self, sink: Sink, offset: int, stride: int = 1):
+        """
+        Parameters:
+            - `sink`: `Sink`
+            - `offset`: `int`
+            - `stride`: `int` = 1
+
+        Notes:
+            - A `stride` of 1 is a contiguous range.
+        """
+        raiseif(
+            stride < 1,
+            UnearthtimeException(f':[{stride}]: Expected a positive stride.')
+        )
+
+        self.__offset = offset
+        self.__sink = sink
+        self.__stride = stride
+        self.ordered = sink.ordered
+
+    @property
+    def offset(self) -> int:
+        return self.__offset
+
+    @property
+    def stride(self) -> int:
+        return self.__stride
+
+    def write(self, index: int, image: Image):
+        self.__sink.write(self.__offset + index * self.__stride, image)
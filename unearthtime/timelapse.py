@@ -1,17 +1,67 @@
-"""The timelapse module defines a wrapper around `timelapse.js`"""
-from functools import partial
+"""The timelapse module defines a wrapper around `timelapse.js`
+
+Attributes:
+    - `FRAME_DRAWN` : `str`
+"""
+from concurrent.futures import Future
+from typing import Callable, Dict, Final, List, Tuple
 
 from selenium.webdriver.remote.webdriver import WebDriver as Driver
 
-from unearthtime._algae.utils import newlambda
+FRAME_DRAWN: Final[str] = '''
+function frameDrawn() {
+    if (typeof timelapse === 'undefined') return false;
+
+    var drawn = typeof timelapse.lastFrameCompletelyDrawn === 'function' ? timelapse.lastFrameCompletelyDrawn() : timelapse.lastFrameCompletelyDrawn,
+        spinner = typeof timelapse.isSpinnerShowing === 'function' && timelapse.isSpinnerShowing();
+
+    return !!drawn && !spinner;
+}
+'''
+
+_Introspect = '''
+if (typeof timelapse === 'undefined') return null;
+
+var members = {};
+
+for (var name in timelapse) {
+    try {
+        var member = timelapse[name];
+        members[name] = [typeof member, typeof member === 'function' ? member.length : -1];
+    } catch (e) {}
+}
+
+return members;
+'''
+
+_Inspect = '''
+var member = timelapse[arguments[0]];
+return typeof member === 'function' ? ['function', member.length, null] : [typeof member, -1, member];
+'''
+
+_Call = 'return timelapse[arguments[0]].apply(timelapse, arguments[1])'
+
+_Get = 'return timelapse[arguments[0]]'
+
+_Batch = '''
+return arguments[0].map(function (op) {
+    var member = timelapse[op[0]];
+    return op[1] === null ? member : member.apply(timelapse, op[1]);
+});
+'''
 
 
 class Timelapse:
     """Wrapper for `timelapse.js`.
 
     All attributes of `timelapse.js` can be accessed via dot-notation. If
-    the attribute represents a function, it will be converted into a lambda
-    expression.
+    the attribute represents a function, it will be converted into a function
+    proxy.
+
+    The members of `timelapse` are introspected once, the first time an attribute
+    is accessed, and the resulting function proxies are cached, so that calling a
+    function or reading a value costs a single round trip. The cache can be cleared
+    with `invalidate` after navigating to a different page.
 
     Examples:
 
@@ -22,16 +72,193 @@ class Timelapse:
 
     def __init__(self, driver: Driver):
         self.__driver = driver
+        self.__members = None
+        self.__proxies = {}
+        self.__view = None
+
+    def __getattr__(self, name: str):
+        if name.startswith('__'):
+            raise AttributeError(name)
+
+        if name in self.__proxies:
+            return self.__proxies[name]
+
+        if self.__members is None:
+            self.__members = self.__driver.execute_script(_Introspect)
+
+        if self.__members and name in self.__members:
+            type_, arity = self.__members[name]
+
+            if type_ == 'function':
+                return self.__proxy(name, arity)
+            else:
+                return self.__driver.execute_script(_Get, name)
+        else:
+            type_, arity, res = self.__driver.execute_script(_Inspect, name)
+
+            if type_ == 'function':
+                self.__remember(name, type_, arity)
+
+                return self.__proxy(name, arity)
+            else:
+                return res
+
+    @property
+    def members(self) -> Dict[str, Tuple[str, int]]:
+        """The introspected members of `timelapse`, mapped to their type and function arity."""
+        if self.__view is None:
+            if self.__members is None:
+                self.__members = self.__driver.execute_script(_Introspect)
+
+            if self.__members is None:
+                return {}
+
+            self.__view = {name: tuple(member) for name, member in self.__members.items()}
+
+        return self.__view
+
+    def batch(self) -> 'TimelapseBatch':
+        """Creates a batch that queues calls and getters, sending them in a single script.
+
+        Returns:
+            - `TimelapseBatch`
+        """
+        return TimelapseBatch(self, self.__driver)
+
+    def invalidate(self):
+        """Clears the introspected members and cached function proxies."""
+        self.__members = None
+        self.__proxies.clear()
+        self.__view = None
+
+    def member(self, name: str) -> Tuple[str, int]:
+        """The type and function arity of a member of `timelapse`.
+
+        Notes:
+            - Members missing from the introspection, e.g. those added after it, are inspected
+            with a round trip, and remembered if they are defined.
+        """
+        if (member := self.members.get(name)) is not None:
+            return member
+
+        type_, arity, _ = self.__driver.execute_script(_Inspect, name)
+
+        if type_ != 'undefined':
+            self.__remember(name, type_, arity)
+
+        return type_, arity
+
+    def __proxy(self, name: str, arity: int) -> Callable:
+        def proxy(*args):
+            return self.__driver.execute_script(_Call, name, list(args))
+
+        proxy.__name__ = name
+        proxy.arity = arity
+
+        self.__proxies[name] = proxy
+
+        return proxy
+
+    def __remember(self, name: str, type_: str, arity: int):
+        if self.__members is not None:
+            self.__members[name] = [type_, arity]
+
+        if self.__view is not None:
+            self.__view[name] = (type_, arity)
+
+
+class TimelapseBatch:
+    """Queued calls to `timelapse.js` sent in a single script.
+
+    Attributes are accessed as on `Timelapse`, but instead of being sent right away
+    each call or getter is queued and a `Future` for its result is returned. The
+    queue is sent when the batch is flushed, which is done on exiting the context.
+
+    Examples:
+
+        with earthtime.timelapse.batch() as b:
+            paused = b.isPaused()
+            times = b.getCaptureTimes()
+
+        frames = len(times.result())
+    """
+
+    def __init__(self, timelapse: Timelapse, driver: Driver):
+        self.__driver = driver
+        self.__futures = []
+        self.__ops = []
+        self.__results = []
+        self.__timelapse = timelapse
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc, val, traceback):
+        if exc is None:
+            self.flush()
+        else:
+            self.cancel()
 
     def __getattr__(self, name: str):
-        res = self.__driver.execute_script(f'return timelapse.{name}')
+        if name.startswith('__'):
+            raise AttributeError(name)
 
-        if isinstance(res, dict) and len(res) == 0 and self.__driver.execute_script(f'return typeof(timelapse.{name})') == 'function':
-            length = self.__driver.execute_script(f'return timelapse.{name}.length')
-            func = {}
+        if self.__timelapse.member(name)[0] == 'function':
+            def queue(*args):
+                return self.__queue(name, list(args))
 
-            exec(newlambda('timelapse', name, length), func)
+            queue.__name__ = name
 
-            return partial(func['f'], self.__driver)
+            return queue
         else:
-            return res
+            return self.__queue(name, None)
+
+    def __len__(self):
+        return len(self.__ops)
+
+    @property
+    def results(self) -> list:
+        """The results of the last flush, in the order they were queued."""
+        return self.__results
+
+    def cancel(self):
+        """Drops every queued call and getter without sending them, cancelling their futures."""
+        futures = self.__futures
+        self.__ops, self.__futures = [], []
+
+        for future in futures:
+            future.cancel()
+
+    def flush(self) -> List:
+        """Sends every queued call and getter in a single script.
+
+        Returns:
+            - `list`
+        """
+        ops, futures = self.__ops, self.__futures
+        self.__ops, self.__futures = [], []
+
+        if not ops:
+            self.__results = []
+            return self.__results
+
+        try:
+            self.__results = self.__driver.execute_script(_Batch, ops)
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+
+            raise
+
+        for future, result in zip(futures, self.__results):
+            future.set_result(result)
+
+        return self.__results
+
+    def __queue(self, name: str, args) -> Future:
+        future = Future()
+
+        self.__ops.append([name, args])
+        self.__futures.append(future)
+
+        return future
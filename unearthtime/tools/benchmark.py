@@ -0,0 +1,237 @@
+"""The benchmark module defines a runner that times layers across several `EarthTime` sessions.
+
+Attributes:
+    - `Cold`: `str` = 'cold'
+    - `First`: `str` = 'first'
+    - `Repeat`: `str` = 'repeat'
+"""
+from __future__ import annotations
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from queue import Empty, Queue
+from typing import Callable, Dict, Final, Iterable, List, Tuple, Union
+
+from selenium.common.exceptions import WebDriverException
+
+from .layer import Catalog, DrawnLayer
+from .._algae.exceptions import UnearthtimeException
+from .._algae.utils import raiseif
+from ..earthtime import EarthTime
+
+Cold: Final[str] = 'cold'
+First: Final[str] = 'first'
+Repeat: Final[str] = 'repeat'
+
+
+@dataclass
+class DrawRun:
+    layer: DrawnLayer
+    run: int
+    kind: str
+    session: int
+    missing: bool = False
+
+    def __repr__(self): return f'{DrawRun.__name__}(Name: {self.layer.name}, Run: {self.run}, Kind: {self.kind}, Session: {self.session}, Time: {self.layer.draw_time}, Missing: {self.missing})'
+
+
+@dataclass
+class DrawSummary:
+    name: str
+    title: str
+    kind: str
+    runs: int
+    drawn: int
+    missing: int
+    p50: float
+    p95: float
+
+    def __repr__(self): return f'{DrawSummary.__name__}(Name: {self.name}, Kind: {self.kind}, Runs: {self.runs}, Drawn: {self.drawn}, Missing: {self.missing}, p50: {self.p50}, p95: {self.p95})'
+
+
+class DrawBenchmark:
+    """Times how long layers take to draw, spreading them across several `EarthTime` sessions.
+
+    Each session reads the Data Library once with `Catalog.extract`, then takes layers from
+    a shared queue until it is empty, so faster sessions do more of the work. A layer is
+    timed `repeats` times on the session that took it; the first run is labelled `Cold`
+    or `First`, and the rest `Repeat`, which draw with the tiles of the layer already in
+    that browser's cache.
+
+    Before the first run of each layer the browser cache is cleared with the Chrome DevTools
+    command `Network.clearBrowserCache`, so the run is a cold start and is labelled `Cold`.
+    This only works on Chromium-based drivers. On others the cache is left as is, and the
+    run is labelled `First`: the first draw of the layer within a session that may already
+    hold shared tiles, e.g. of the base map, so no cold figure is produced.
+    """
+
+    def __init__(self, sessions: Iterable[EarthTime], repeats: int = 3, timeout: Union[float, int] = 30):
+        """
+        Parameters:
+            - `sessions`: `Iterable[EarthTime]`
+            - `repeats`: `int` = 3
+            - `timeout`: `float`, `int` = 30
+
+        Raises:
+            - `UnearthtimeException`: No sessions, an inactive session, or fewer than one repeat.
+
+        Notes:
+            - Sessions can be the `pages` of a `ConcurrentEarthtime` or pages acquired from an
+            `EarthTimePool`. Each session is driven by its own thread.
+        """
+        self.__sessions = list(sessions)
+
+        raiseif(
+            not self.__sessions or not all(self.__sessions),
+            UnearthtimeException('Expected at least one active EarthTime page.')
+        )
+
+        raiseif(
+            repeats < 1,
+            UnearthtimeException(f':[{repeats}]: Expected at least one repeat.')
+        )
+
+        self.__repeats = repeats
+        self.__timeout = timeout
+
+    @property
+    def repeats(self) -> int:
+        return self.__repeats
+
+    @property
+    def sessions(self) -> List[EarthTime]:
+        return self.__sessions
+
+    def run(self, categories: Iterable[str] = None, condition: Callable[[str], bool] = None) -> DrawBenchmarkResults:
+        """Times every layer of the given categories.
+
+        Parameters:
+            - `categories`: `Iterable[str]` = `None`
+            - `condition`: `(str) -> bool` = `None`
+
+        Returns:
+            - `DrawBenchmarkResults`
+
+        Notes:
+            - Categories are keyed by the `aria-controls` of their header, as in `Catalog`. If
+            `None`, every category is timed.
+            - `condition` filters layers by name, as in `Category.time_layers`.
+            - A layer missing from the catalog of the session that takes it is recorded as
+            a single missing run instead of being timed.
+        """
+        catalog = Catalog.extract(self.__sessions[0])
+        keys = list(catalog.categories) if categories is None else [key for key in categories if key in catalog]
+        names = list(dict.fromkeys(
+            layer.name for key in keys for layer in catalog[key] if condition is None or condition(layer.name)))
+
+        queue = Queue()
+
+        for name in names:
+            queue.put(name)
+
+        runs = []
+
+        with ThreadPoolExecutor(max_workers=len(self.__sessions)) as executor:
+            for session_runs in executor.map(lambda item: self.__work(*item, queue, catalog if item[0] == 0 else None),
+                                             enumerate(self.__sessions)):
+                runs.extend(session_runs)
+
+        order = {name: i for i, name in enumerate(names)}
+        runs.sort(key=lambda run: (order.get(run.layer.name, len(order)), run.run))
+
+        return DrawBenchmarkResults(runs)
+
+    def __work(self, index: int, earthtime: EarthTime, queue: Queue, catalog: Catalog = None) -> List[DrawRun]:
+        catalog = catalog if catalog is not None else Catalog.extract(earthtime)
+        runs = []
+
+        while True:
+            try:
+                name = queue.get_nowait()
+            except Empty:
+                return runs
+
+            if not (layer := catalog.layer(name)):
+                runs.append(DrawRun(DrawnLayer(name, '', 0, 0, False), 0, First, index, True))
+                continue
+
+            for run in range(self.__repeats):
+                kind = (Cold if DrawBenchmark.__clear_cache(earthtime) else First) if run == 0 else Repeat
+                drawn = layer.draw_time(self.__timeout) or DrawnLayer(layer.name, layer.title, 0, 0, False)
+                runs.append(DrawRun(drawn, run, kind, index))
+
+    @staticmethod
+    def __clear_cache(earthtime: EarthTime) -> bool:
+        try:
+            earthtime.driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        except (AttributeError, WebDriverException):
+            return False
+
+        return True
+
+
+class DrawBenchmarkResults(Tuple[DrawRun]):
+    """The runs of a `DrawBenchmark`, in layer order."""
+
+    def __new__(cls, runs: Iterable[DrawRun] = None):
+        return super().__new__(cls, runs if runs else ())
+
+    def __repr__(self):
+        return '%s[%s]' % (DrawBenchmarkResults.__name__, '\n\t%s\n' % '\n\t'.join(map(str, self)) if self else '')
+
+    def by_layer(self) -> Dict[str, List[DrawRun]]:
+        layers = {}
+
+        for run in self:
+            layers.setdefault(run.layer.name, []).append(run)
+
+        return layers
+
+    def summary(self, drawn_only: bool = True) -> List[DrawSummary]:
+        """Summarizes the runs of each layer by kind.
+
+        Parameters:
+            - `drawn_only`: `bool` = `True`
+
+        Returns:
+            - `[DrawSummary]`
+
+        Notes:
+            - If `drawn_only`, runs that timed out are excluded from the percentiles, but are
+            still counted in `runs`.
+            - Missing runs are only counted in `missing`.
+            - Percentiles are linearly interpolated between the closest ranks.
+            - First runs are summarized as `Cold` only if the cache could be cleared before
+            them, and as `First` otherwise. A summary of kind `First` is not a cold-cache figure.
+        """
+        summaries = []
+
+        for name, runs in self.by_layer().items():
+            for kind in (Cold, First, Repeat):
+                if not (kinds := [run for run in runs if run.kind == kind]):
+                    continue
+
+                timed = [run for run in kinds if not run.missing]
+                times = sorted(run.layer.draw_time for run in timed if run.layer.drawn or not drawn_only)
+                summaries.append(DrawSummary(
+                    name,
+                    next((run.layer.title for run in timed), ''),
+                    kind,
+                    len(timed),
+                    sum(run.layer.drawn for run in timed),
+                    len(kinds) - len(timed),
+                    DrawBenchmarkResults.__percentile(times, 50),
+                    DrawBenchmarkResults.__percentile(times, 95)))
+
+        return summaries
+
+    @staticmethod
+    def __percentile(values: List[float], q: Union[float, int]) -> float:
+        if not values:
+            return math.nan
+
+        rank = (len(values) - 1) * q / 100
+        low, high = math.floor(rank), math.ceil(rank)
+
+        return values[low] + (values[high] - values[low]) * (rank - low)
@@ -1,9 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from time import sleep
-from timeit import default_timer as timer
-from typing import Union, Callable
+from typing import Callable, Dict, Iterable, List, Union
 
 from selenium.common.exceptions import ElementNotInteractableException
 from selenium.common.exceptions import StaleElementReferenceException
@@ -15,7 +13,75 @@ from .._algae.exceptions import UnearthtimeException
 from .._algae.strings import noneorempty
 from .._algae.utils import raiseif
 from ..earthtime import EarthTime
+from ..explore.query import script_timeout
 from ..explore.response import Hit, Miss, MissType
+from ..explore.script import FIND_ALTERNATIVES, TEXT
+from ..timelapse import FRAME_DRAWN
+
+_DrawRecorder = FRAME_DRAWN + '''
+var checkbox = arguments[0], timeout = arguments[1];
+var recorder = window.__unearthtimeDrawRecorder = {selected: null, drawn: null, frames: 0, done: false, callback: null};
+
+function finish() {
+    if (recorder.done) return;
+    recorder.done = true;
+    if (recorder.callback) recorder.callback(recorder);
+}
+
+function poll() {
+    recorder.frames++;
+
+    if (frameDrawn()) {
+        recorder.drawn = performance.now();
+        finish();
+    } else if (performance.now() - recorder.selected > timeout) {
+        finish();
+    } else {
+        requestAnimationFrame(poll);
+    }
+}
+
+checkbox.addEventListener('change', function () {
+    recorder.selected = performance.now();
+    requestAnimationFrame(function () { requestAnimationFrame(poll); });
+}, {once: true});
+
+setTimeout(finish, timeout * 2);
+'''
+
+_Catalog = FIND_ALTERNATIVES + TEXT + '''
+return findAlternatives(document, arguments[0], true, true).elements.map(function (header) {
+    var table = document.getElementById(header.getAttribute('aria-controls'));
+    var labels = table ? table.querySelectorAll('tr > td > label') : [];
+
+    return {
+        id: header.id,
+        controls: header.getAttribute('aria-controls'),
+        name: text(header),
+        layers: Array.prototype.map.call(labels, function (label) {
+            var row = label.closest('tr'), checkbox = label.querySelector('input');
+
+            return {
+                name: label.getAttribute('name'),
+                title: text(label),
+                description: text(row && row.querySelector('div.layer-description')),
+                checkbox: checkbox,
+                checked: !!(checkbox && checkbox.checked)
+            };
+        })
+    };
+});
+'''
+
+_DrawResult = '''
+var callback = arguments[arguments.length - 1], recorder = window.__unearthtimeDrawRecorder;
+
+if (!recorder || recorder.done) {
+    callback(recorder || null);
+} else {
+    recorder.callback = callback;
+}
+'''
 
 
 @dataclass
@@ -106,30 +172,40 @@ class Layer(SelectableTool):
     def title(self) -> str:
         return self.__title
 
-    def draw_time(self) -> DrawnLayer:
-        if self.inform() and self.__title:
-            start = timer()
+    def draw_time(self, timeout: Union[float, int] = 30) -> DrawnLayer:
+        """Times how long this layer takes to be completely drawn once selected.
 
-            self.select()
+        A recorder is installed in the page that timestamps the selection of the layer
+        and polls for the first completely drawn frame on each animation frame, using
+        `performance.now()`. The result is fetched once the frame is drawn, or after
+        `timeout` seconds.
 
-            drawn = self._earthtime.lastFrameCompletelyDrawn
-            draw_calls = 1
+        Parameters:
+            - `timeout`: `float`, `int` = 30
 
-            while not drawn:
-                sleep(0.5)
-                drawn = self._earthtime.lastFrameCompletelyDrawn
-                draw_calls += 1
+        Returns:
+            - `DrawnLayer`
 
-                if not self._earthtime.isSpinnerShowing() and draw_calls >= 60:
-                    break
+        Notes:
+            - `draw_calls` of the result is the number of animation frames polled.
+        """
+        if self.inform() and self.__title:
+            self._earthtime.execute(_DrawRecorder, self.__checkbox._element, timeout * 1000)
+
+            self.select()
 
-            end = timer()
+            with script_timeout(self._earthtime.driver, timeout * 2 + 5):
+                recorder = self._earthtime.execute_async_script(_DrawResult)
 
             self.select()
 
-            total_time = end - start
+            if recorder and recorder['selected'] is not None:
+                drawn = recorder['drawn'] is not None
+                end = recorder['drawn'] if drawn else recorder['selected'] + timeout * 1000
 
-            return DrawnLayer(self.__name, self.__title, total_time, draw_calls, drawn)
+                return DrawnLayer(self.__name, self.__title, (end - recorder['selected']) / 1000, recorder['frames'], drawn)
+            else:
+                return DrawnLayer(self.__name, self.__title, 0, 0, False)
         else:
             return DrawnLayer('', '', 0, 0, False)
 
@@ -156,6 +232,7 @@ class Layer(SelectableTool):
             elif clear := self._earthtime.DataLibrarySearchClearButton:
                 clear.click()
 
+            header = header.prefetch()
             self.__category_id = header.id_
 
             if header['aria-selected'] == 'false':
@@ -184,6 +261,13 @@ class Layer(SelectableTool):
     def is_selected(self) -> bool:
         return bool(self.__checkbox) and self.__checkbox.checked
 
+    def _prefill(self, category_name: str, title: str, description: str, checkbox: Hit):
+        self.__category_name = category_name
+        self.__checkbox = checkbox
+        self.__description = description
+        self.__title = title
+        self._informed = True
+
     @returnonexception(None, StaleElementReferenceException)
     def select(self):
         if self.inform():
@@ -291,7 +375,7 @@ class Category(SelectableTool):
         elif clear := earthtime.DataLibrarySearchClearButton:
             clear.click()
 
-        categories = {category['aria-controls']: Category(category.id_, earthtime) for category in headers} if (headers := earthtime.CategoryHeaders) else {}
+        categories = {category['aria-controls']: Category(category.id_, earthtime) for category in headers.prefetch()} if (headers := earthtime.CategoryHeaders) else {}
 
         if inform:
             for category in categories.values():
@@ -319,7 +403,7 @@ class Category(SelectableTool):
         elif clear := earthtime.DataLibrarySearchClearButton:
             clear.click()
 
-        categories = {category['aria-controls']: Category(category.id_, earthtime) for category in headers} if (headers := earthtime['CategoryHeadersAfter', category_id]) else {}
+        categories = {category['aria-controls']: Category(category.id_, earthtime) for category in headers.prefetch()} if (headers := earthtime['CategoryHeadersAfter', category_id]) else {}
 
         if inform:
             for category in categories.values():
@@ -347,7 +431,7 @@ class Category(SelectableTool):
         elif clear := earthtime.DataLibrarySearchClearButton:
             clear.click()
 
-        categories = {category['aria-controls']: Category(category.id_, earthtime) for category in headers} if (headers := earthtime['CategoryHeadersExcept', category_id]) else {}
+        categories = {category['aria-controls']: Category(category.id_, earthtime) for category in headers.prefetch()} if (headers := earthtime['CategoryHeadersExcept', category_id]) else {}
 
         if inform:
             for category in categories.values():
@@ -389,6 +473,7 @@ class Category(SelectableTool):
             elif clear := self._earthtime.DataLibrarySearchClearButton:
                 clear.click()
 
+            header = header.prefetch()
             self.__category_id = header.id_
             self.__category_name = header.text
 
@@ -397,7 +482,7 @@ class Category(SelectableTool):
                 header.click()
 
             if labels := self._earthtime['CategoryLabels', self.__category_id]:
-                layers = [Layer(label.name, self.__category_id, self._earthtime) for label in labels]
+                layers = [Layer(label.name, self.__category_id, self._earthtime) for label in labels.prefetch()]
                 self.__layers = [layer for layer in layers if layer.inform()]
                 self.__layer_names = {self.__layers[i].name: i for i in range(len(self.__layers))}
                 self._informed = len(layers) == len(self.__layers)
@@ -412,6 +497,12 @@ class Category(SelectableTool):
         else:
             return False
 
+    def _prefill(self, category_name: str, layers: List[Layer]):
+        self.__category_name = category_name
+        self.__layers = layers
+        self.__layer_names = {layers[i].name: i for i in range(len(layers))}
+        self._informed = True
+
     @returnonexception(None, StaleElementReferenceException)
     def select(self):
         if self.inform():
@@ -480,6 +571,7 @@ class Category(SelectableTool):
             elif clear := self._earthtime.DataLibrarySearchClearButton:
                 clear.click()
 
+            header = header.prefetch()
             self.__category_id = header.id_
             self.__category_name = header.text
 
@@ -488,7 +580,7 @@ class Category(SelectableTool):
                 header.click()
 
             if labels := self._earthtime['CategoryLabels', self.__category_id]:
-                layers = [Layer(label.name, self.__category_id, self._earthtime) for label in labels]
+                layers = [Layer(label.name, self.__category_id, self._earthtime) for label in labels.prefetch()]
                 self.__layers = [layer for layer in layers if layer.inform()]
                 self.__layer_names = {self.__layers[i].name: i for i in range(len(self.__layers))}
 
@@ -510,3 +602,83 @@ class Category(SelectableTool):
             return layer_times
         else:
             return []
+
+
+class Catalog:
+    """The categories and layers of the Data Library, read from the DOM in a single script.
+
+    Categories are keyed by the `aria-controls` of their header, as in `Category.layers_by_category`.
+    """
+
+    def __init__(self, categories: Dict[str, Category], selected: Iterable[str] = ()):
+        self.__categories = categories
+        self.__selected = list(selected)
+
+    def __contains__(self, key: str):
+        return key in self.__categories
+
+    def __getitem__(self, key: str) -> Union[Category, MissType]:
+        return self.__categories.get(key, Miss)
+
+    def __iter__(self):
+        for category in self.__categories.values():
+            yield category
+
+    def __len__(self):
+        return len(self.__categories)
+
+    def __repr__(self):
+        return '%s[%s]' % (Catalog.__name__, '\n\t%s\n' % '\n\t'.join(map(str, self)) if self.__categories else '')
+
+    @classmethod
+    def extract(cls, earthtime: EarthTime) -> Catalog:
+        """Reads every category and layer of the Data Library without toggling any menus.
+
+        Parameters:
+            - `earthtime`: `EarthTime`
+
+        Returns:
+            - `Catalog`: Informed `Category` and `Layer` objects.
+        """
+        if earthtime is None or not bool(earthtime):
+            return cls({})
+
+        alternatives = earthtime.registry['CategoryHeaders'].alternatives()
+        categories, selected = {}, []
+
+        for entry in earthtime.execute(_Catalog, alternatives):
+            category = Category(entry['id'], earthtime)
+            layers = []
+
+            for info in entry['layers']:
+                layer = Layer(info['name'], entry['id'], earthtime)
+                layer._prefill(entry['name'], info['title'], info['description'], Hit(info['checkbox']) if info['checkbox'] else None)
+                layers.append(layer)
+
+                if info['checked']:
+                    selected.append(info['name'])
+
+            category._prefill(entry['name'], layers)
+            categories[entry['controls']] = category
+
+        return cls(categories, selected)
+
+    @property
+    def categories(self) -> Dict[str, Category]:
+        return self.__categories
+
+    @property
+    def layers(self) -> List[Layer]:
+        return [layer for category in self for layer in category]
+
+    @property
+    def selected(self) -> List[str]:
+        """The names of the layers that were checked when the catalog was extracted."""
+        return self.__selected
+
+    def layer(self, name: str) -> Union[Layer, MissType]:
+        for category in self:
+            if name in category:
+                return category[name]
+        else:
+            return Miss
@@ -1,30 +1,50 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from time import sleep
-from typing import Union, Tuple, Iterable
+from typing import Dict, Iterable, List, Set, Tuple, Union
 
 from selenium.common.exceptions import ElementNotInteractableException
 from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.remote.webelement import WebElement as Element
 
+from .layer import Catalog, Layer
 from .tool import Tool
 from .._algae.deco import returnonexception
+from .._algae.strings import spaces
 from ..earthtime import EarthTime
 from ..explore.response import Hit, Miss
 
 
 class DLSearchResult:
 
-    def __init__(self, label: Union[Element, Hit], category_name: str, earthtime: EarthTime):
+    def __init__(self, label: Union[Element, Hit, None], category_name: str, earthtime: EarthTime, layer: Layer = None):
+        """
+        Parameters:
+            - `label`: `WebElement`, `Hit`, `None`
+            - `category_name`: `str`
+            - `earthtime`: `EarthTime`
+            - `layer`: `Layer` = None
+
+        Notes:
+            - If an informed `layer` is provided, the title and checkbox are taken from
+            it instead of the DOM, and `label` may be `None`.
+        """
 
         if isinstance(label, Element):
             label = Hit(label)
 
         self.__category_name = category_name
-        self.__checkbox = Hit(label.find_element_by_tag_name('input'))
         self.__earthtime = earthtime
         self.__label = label
-        self.__title = label.text.strip()
+        self.__layer = layer
+
+        if layer is not None:
+            self.__checkbox = layer.checkbox
+            self.__title = layer.title
+        else:
+            self.__checkbox = Hit(label.find_element_by_tag_name('input'))
+            self.__title = label.text.strip()
 
     def __repr__(self):
         return f'{DLSearchResult.__name__} : [{self.__category_name} : {self.__title}'
@@ -35,14 +55,25 @@ class DLSearchResult:
 
     @property
     def label(self) -> Hit:
+        if self.__label is None and self.__checkbox:
+            self.__label = self.__checkbox.parent_element()
+
         return self.__label
 
+    @property
+    def layer(self) -> Union[Layer, None]:
+        return self.__layer
+
     @property
     def title(self):
         return self.__title
 
     def select(self):
-        if bool(self.__earthtime) and self.__checkbox.is_displayed():
+        if not bool(self.__earthtime):
+            return
+        elif self.__layer is not None:
+            self.__layer.select()
+        elif self.__checkbox.is_displayed():
             self.__checkbox.click()
 
 
@@ -162,3 +193,97 @@ class DLSearchEngine(Tool):
                 return DLSearchResults(query)
         else:
             return DLSearchResults()
+
+
+class DLIndexedSearchEngine(Tool):
+    """Searches the Data Library in-process, without typing into the page.
+
+    The layers of the Data Library are read once with `Catalog.extract`, and their titles,
+    names and descriptions are indexed by character n-grams. A query matches a layer if
+    every whitespace-separated word of the query is found in that text, ignoring case.
+    """
+
+    def __init__(self, earthtime: EarthTime, n: int = 3):
+        super().__init__(earthtime)
+        self.__catalog = None
+        self.__grams: Dict[str, Set[int]] = {}
+        self.__layers: List[Layer] = []
+        self.__n = max(1, n)
+        self.__query = ''
+        self.__texts: List[str] = []
+
+    @classmethod
+    def informed(cls, earthtime: EarthTime, n: int = 3):
+        dls = cls(earthtime, n)
+        dls.inform()
+
+        return dls
+
+    @classmethod
+    def from_catalog(cls, catalog: Catalog, earthtime: EarthTime, n: int = 3):
+        dls = cls(earthtime, n)
+        dls.__index(catalog)
+
+        return dls
+
+    @property
+    def catalog(self) -> Catalog:
+        return self.__catalog
+
+    def clear(self):
+        self.__query = ''
+
+    def inform(self) -> bool:
+        if self._informed:
+            return bool(self._earthtime)
+        elif self.informable():
+            self.__index(Catalog.extract(self._earthtime))
+
+        return self._informed
+
+    def search(self, query: str, clear: bool = True) -> DLSearchResults:
+        if not self.inform():
+            return DLSearchResults()
+
+        self.__query = query if clear else self.__query + query
+
+        words = DLIndexedSearchEngine.__normalize(self.__query).split(' ')
+        words = [word for word in words if word]
+
+        if not words:
+            return DLSearchResults(self.__query)
+
+        candidates = None
+
+        for word in words:
+            if len(word) >= self.__n:
+                postings = sorted((self.__grams.get(word[i:i + self.__n], set()) for i in range(len(word) - self.__n + 1)), key=len)
+                matches = set(postings[0]).intersection(*postings[1:])
+                candidates = matches if candidates is None else candidates & matches
+
+                if not candidates:
+                    return DLSearchResults(self.__query)
+
+        indices = sorted(candidates) if candidates is not None else range(len(self.__layers))
+        results = [DLSearchResult(None, self.__layers[i].category_name, self._earthtime, self.__layers[i])
+                   for i in indices if all(word in self.__texts[i] for word in words)]
+
+        return DLSearchResults(self.__query, results)
+
+    def __index(self, catalog: Catalog):
+        grams = defaultdict(set)
+
+        self.__catalog = catalog
+        self.__layers = catalog.layers
+        self.__texts = [DLIndexedSearchEngine.__normalize(' '.join((layer.title, layer.name, layer.description))) for layer in self.__layers]
+
+        for i, text in enumerate(self.__texts):
+            for gram in {text[j:j + self.__n] for j in range(len(text) - self.__n + 1)}:
+                grams[gram].add(i)
+
+        self.__grams = dict(grams)
+        self._informed = True
+
+    @staticmethod
+    def __normalize(text: str) -> str:
+        return spaces.sub(' ', text or '').strip().lower()
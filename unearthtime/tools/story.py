@@ -1,4 +1,6 @@
-from typing import Union
+from __future__ import annotations
+
+from typing import Dict, List, Union
 
 from selenium.common.exceptions import ElementNotInteractableException
 from selenium.common.exceptions import StaleElementReferenceException
@@ -10,8 +12,32 @@ from .._algae.exceptions import UnearthtimeException
 from .._algae.strings import prefix
 from .._algae.utils import raiseif
 from ..earthtime import EarthTime
-from ..imaging.image import Dimension, Thumbnail
+from ..imaging.image import Thumbnail
 from ..explore.response import Hit, Miss, MissType
+from ..explore.script import FIND_ALTERNATIVES, TEXT
+
+_Stories = FIND_ALTERNATIVES + TEXT + '''
+return findAlternatives(document, arguments[0], true, true).elements.map(function (header) {
+    var table = document.getElementById(header.getAttribute('aria-controls'));
+    var rows = table ? table.querySelectorAll('tr:not(:first-child)') : [];
+
+    return {
+        id: header.id,
+        controls: header.getAttribute('aria-controls'),
+        name: text(header),
+        stories: Array.prototype.filter.call(rows, function (row) { return !!row.id; }).map(function (row) {
+            var img = row.querySelector('img');
+
+            return {
+                id: row.id,
+                title: text(row.querySelector(':scope > td:nth-child(3)')),
+                thumbnail: img ? img.src : '',
+                radio: row.querySelector('input')
+            };
+        })
+    };
+});
+'''
 
 
 class Story(SelectableTool):
@@ -65,6 +91,7 @@ class Story(SelectableTool):
                 if not header:
                     return False
 
+            header = header.prefetch()
             self.__theme_id = header.id_
 
             if header['aria-selected'] == 'false':
@@ -75,14 +102,7 @@ class Story(SelectableTool):
             self.__radio = self._earthtime['StoryRadioButton', self.__story_id]
             self.__title = self._earthtime['StoryTitle', self.__story_id].text
 
-            src = self._earthtime['StoryThumbnail', self.__story_id].src
-
-            wstart, hstart = src.find('width=') + 6, src.find('height=') + 7
-            wstop, hstop = src.find('&', wstart), src.find('&', hstart)
-
-            dim = Dimension(int(src[wstart:wstop]), int(src[hstart:hstop]))
-
-            self.__thumbnail = Thumbnail(src, dim)
+            self.__thumbnail = Thumbnail.from_url(self._earthtime['StoryThumbnail', self.__story_id].src, strict=False)
             self._informed = True
 
             if close_theme:
@@ -93,6 +113,13 @@ class Story(SelectableTool):
 
         return self._informed
 
+    def _prefill(self, theme: str, title: str, thumbnail: Thumbnail, radio: Hit):
+        self.__radio = radio
+        self.__theme = theme
+        self.__thumbnail = thumbnail
+        self.__title = title
+        self._informed = True
+
     @returnonexception(None, StaleElementReferenceException)
     def select(self):
         if self.inform():
@@ -190,7 +217,7 @@ class Theme(SelectableTool):
             menu = True
             earthtime.StoriesMenu.click()
 
-        themes = {theme['aria-controls']: Theme(theme.id_, earthtime) for theme in headers} if (headers := earthtime.ThemeHeaders) else {}
+        themes = {theme['aria-controls']: Theme(theme.id_, earthtime) for theme in headers.prefetch()} if (headers := earthtime.ThemeHeaders) else {}
 
         if inform:
             for theme in themes.values():
@@ -226,6 +253,7 @@ class Theme(SelectableTool):
                 if not header:
                     return False
 
+            header = header.prefetch()
             self.__theme_id = header.id_
 
             if header['aria-selected'] == 'false':
@@ -235,7 +263,7 @@ class Theme(SelectableTool):
             self.__theme_name = header.text
 
             if rows := self._earthtime['ThemeStories', self.__theme_id]:
-                stories = [Story(story.id_, self.__theme_id, self._earthtime) for story in rows]
+                stories = [Story(story.id_, self.__theme_id, self._earthtime) for story in rows.prefetch()]
                 self.__stories = [story for story in stories if story.inform()]
                 self.__story_ids = {self.__stories[i].story_id: i for i in range(len(self.__stories))}
                 self._informed = len(stories) == len(self.__stories)
@@ -248,6 +276,12 @@ class Theme(SelectableTool):
 
         return self._informed
 
+    def _prefill(self, theme_name: str, stories: List[Story]):
+        self.__theme_name = theme_name
+        self.__stories = stories
+        self.__story_ids = {stories[i].story_id: i for i in range(len(stories))}
+        self._informed = True
+
     @returnonexception(None, StaleElementReferenceException)
     def select(self):
         if self.inform():
@@ -259,3 +293,68 @@ class Theme(SelectableTool):
 
             if header['aria-selected'] == 'false':
                 header.click()
+
+
+class StoryCatalog:
+    """The themes and stories of the Stories menu, read from the DOM in a single script.
+
+    Themes are keyed by the `aria-controls` of their header, as in `Theme.stories_by_theme`.
+    """
+
+    def __init__(self, themes: Dict[str, Theme]):
+        self.__themes = themes
+
+    def __contains__(self, key: str):
+        return key in self.__themes
+
+    def __getitem__(self, key: str) -> Union[Theme, MissType]:
+        return self.__themes.get(key, Miss)
+
+    def __iter__(self):
+        for theme in self.__themes.values():
+            yield theme
+
+    def __len__(self):
+        return len(self.__themes)
+
+    def __repr__(self):
+        return '%s[%s]' % (StoryCatalog.__name__, '\n\t%s\n' % '\n\t'.join(map(str, self)) if self.__themes else '')
+
+    @classmethod
+    def extract(cls, earthtime: EarthTime) -> StoryCatalog:
+        """Reads every theme and story of the Stories menu without toggling any menus.
+
+        Parameters:
+            - `earthtime`: `EarthTime`
+
+        Returns:
+            - `StoryCatalog`: Informed `Theme` and `Story` objects.
+        """
+        if earthtime is None or not bool(earthtime):
+            return cls({})
+
+        alternatives = earthtime.registry['ThemeHeaders'].alternatives()
+        themes = {}
+
+        for entry in earthtime.execute(_Stories, alternatives):
+            theme = Theme(entry['id'], earthtime)
+            stories = []
+
+            for info in entry['stories']:
+                story = Story(info['id'], entry['id'], earthtime)
+                thumbnail = Thumbnail.from_url(info['thumbnail'], strict=False)
+                story._prefill(entry['name'], info['title'], thumbnail, Hit(info['radio']) if info['radio'] else None)
+                stories.append(story)
+
+            theme._prefill(entry['name'], stories)
+            themes[entry['controls']] = theme
+
+        return cls(themes)
+
+    @property
+    def stories(self) -> List[Story]:
+        return [story for theme in self for story in theme]
+
+    @property
+    def themes(self) -> Dict[str, Theme]:
+        return self.__themes
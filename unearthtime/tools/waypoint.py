@@ -7,7 +7,28 @@ from .tool import SelectableTool
 from .._algae.deco import returnonexception
 from .._algae.utils import until
 from ..earthtime import EarthTime
-from ..imaging.image import Thumbnail, Dimension
+from ..explore.response import Hit
+from ..explore.script import FIND_ALTERNATIVES, TEXT
+from ..imaging.image import Thumbnail
+
+_Waypoints = FIND_ALTERNATIVES + TEXT + '''
+var keyframe = 'timeMachine_snaplapse_keyframe_';
+
+return findAlternatives(document, arguments[0], true, true).elements.map(function (waypoint) {
+    var id = waypoint.id.indexOf(keyframe) === 0 ? waypoint.id : keyframe + waypoint.id;
+    var title = document.getElementById(id + '_title') || waypoint.querySelector('div.snaplapse_keyframe_list_item_title');
+    var thumbnail = document.getElementById(id + '_thumbnail') || waypoint.querySelector('img');
+
+    if (thumbnail && thumbnail.tagName !== 'IMG') thumbnail = thumbnail.querySelector('img');
+
+    return {
+        id: waypoint.id,
+        element: waypoint,
+        title: text(title),
+        thumbnail: thumbnail ? thumbnail.src : ''
+    };
+});
+'''
 
 
 class Waypoint(SelectableTool):
@@ -29,6 +50,29 @@ class Waypoint(SelectableTool):
 
         return waypoint
 
+    @staticmethod
+    def extract(earthtime: EarthTime) -> list:
+        """Reads the id, title and thumbnail of every waypoint in a single script.
+
+        Parameters:
+            - `earthtime`: `EarthTime`
+
+        Returns:
+            - `[Waypoint,]`: Informed waypoints, with thumbnail dimensions parsed from their urls.
+        """
+        if earthtime is None or not bool(earthtime):
+            return []
+
+        alternatives = earthtime.registry['Waypoints'].alternatives()
+        waypoints = []
+
+        for info in earthtime.execute(_Waypoints, alternatives):
+            waypoint = Waypoint(info['id'], earthtime)
+            waypoint._prefill(Hit(info['element']), info['title'], Thumbnail.from_url(info['thumbnail'], strict=False))
+            waypoints.append(waypoint)
+
+        return waypoints
+
     @staticmethod
     def waypoints(earthtime: EarthTime) -> list:
         return [Waypoint(waypoint.id_, earthtime) for waypoint in waypoints] if bool(earthtime) and (waypoints := earthtime.Waypoints) else []
@@ -54,18 +98,17 @@ class Waypoint(SelectableTool):
             self.__waypoint_id = waypoint.id_
             self.__title = self._earthtime['WaypointTitle', self.__waypoint_id].text
 
-            src = self._earthtime['WaypointThumbnail', self.__waypoint_id]
-
-            wstart, hstart = src.find('width=') + 6, src.find('height=') + 7
-            wstop, hstop = src.find('&', wstart), src.find('&', hstart)
-
-            dim = Dimension(int(src[wstart:wstop]), int(src[hstart:hstop]))
-
-            self.__thumbnail = Thumbnail(src, dim)
+            self.__thumbnail = Thumbnail.from_url(self._earthtime['WaypointThumbnail', self.__waypoint_id].src, strict=False)
             self._informed = True
 
         return self._informed
 
+    def _prefill(self, waypoint: Hit, title: str, thumbnail: Thumbnail):
+        self.__thumbnail = thumbnail
+        self.__title = title
+        self.__waypoint = waypoint
+        self._informed = True
+
     @returnonexception(None, StaleElementReferenceException)
     def select(self):
         if self.inform():